@@ -0,0 +1,35 @@
+"""add adaptive scheduling columns to sources
+
+Revision ID: a5c2e8f4d1b6
+Revises: f4b1d7e3c9a5
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a5c2e8f4d1b6"
+down_revision: Union[str, None] = "f4b1d7e3c9a5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("sources", sa.Column("current_interval_minutes", sa.Integer(), nullable=True))
+    op.add_column("sources", sa.Column("interval_reason", sa.String(length=256), nullable=True))
+    op.add_column("sources", sa.Column("new_jobs_per_hour", sa.Float(), nullable=True))
+    op.add_column(
+        "sources",
+        sa.Column("consecutive_failures", sa.Integer(), server_default=sa.text("0"), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("sources", "consecutive_failures")
+    op.drop_column("sources", "new_jobs_per_hour")
+    op.drop_column("sources", "interval_reason")
+    op.drop_column("sources", "current_interval_minutes")
@@ -0,0 +1,57 @@
+"""add source_id and filter indexes to jobs
+
+Revision ID: a8c5e3f1b9d4
+Revises: f7b4d2e9a6c8
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a8c5e3f1b9d4"
+down_revision: Union[str, None] = "f7b4d2e9a6c8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("jobs", sa.Column("source_id", sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        "jobs_source_id_fkey", "jobs", "sources", ["source_id"], ["id"], ondelete="SET NULL"
+    )
+    # Backfill from the free-text source name; duplicate names map to the oldest source.
+    op.execute(
+        """
+        UPDATE jobs
+        SET source_id = matched.id
+        FROM (SELECT name, min(id) AS id FROM sources GROUP BY name) AS matched
+        WHERE jobs.source = matched.name AND jobs.source_id IS NULL
+        """
+    )
+    op.create_index(
+        "ix_jobs_source_id_scraped_at_id",
+        "jobs",
+        ["source_id", "scraped_at", "id"],
+        unique=False,
+    )
+    op.create_index("ix_jobs_company", "jobs", ["company"], unique=False)
+    op.create_index(
+        "ix_jobs_location_trgm",
+        "jobs",
+        ["location"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"location": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_location_trgm", table_name="jobs")
+    op.drop_index("ix_jobs_company", table_name="jobs")
+    op.drop_index("ix_jobs_source_id_scraped_at_id", table_name="jobs")
+    op.drop_constraint("jobs_source_id_fkey", "jobs", type_="foreignkey")
+    op.drop_column("jobs", "source_id")
@@ -0,0 +1,30 @@
+"""add lease columns to scrape_runs
+
+Revision ID: b6d3f9a5e2c7
+Revises: a5c2e8f4d1b6
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b6d3f9a5e2c7"
+down_revision: Union[str, None] = "a5c2e8f4d1b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("scrape_runs", sa.Column("lease_owner", sa.String(length=128), nullable=True))
+    op.add_column(
+        "scrape_runs", sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("scrape_runs", "lease_expires_at")
+    op.drop_column("scrape_runs", "lease_owner")
@@ -0,0 +1,26 @@
+"""add resource_profile to sources
+
+Revision ID: b7d2e5f8a3c1
+Revises: f6a9b3c1d2e4
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d2e5f8a3c1"
+down_revision: Union[str, None] = "f6a9b3c1d2e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("sources", sa.Column("resource_profile", sa.String(length=16), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("sources", "resource_profile")
@@ -0,0 +1,47 @@
+"""add job_daily_stats table
+
+Revision ID: c1e7a9d3f5b2
+Revises: b9d6f4a2c8e1
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c1e7a9d3f5b2"
+down_revision: Union[str, None] = "b9d6f4a2c8e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+job_status = postgresql.ENUM(
+    "NEW", "SEEN", "APPLIED", "REJECTED", "IGNORED", name="jobstatus", create_type=False
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_daily_stats",
+        sa.Column("source_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("status", job_status, nullable=False),
+        sa.Column("job_count", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("source_id", "day", "status"),
+    )
+    # Seed the rollups from existing jobs; source_id 0 means "no source".
+    op.execute(
+        """
+        INSERT INTO job_daily_stats (source_id, day, status, job_count)
+        SELECT coalesce(source_id, 0), (scraped_at AT TIME ZONE 'UTC')::date, status, count(*)
+        FROM jobs
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("job_daily_stats")
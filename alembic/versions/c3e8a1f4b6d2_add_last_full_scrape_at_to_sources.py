@@ -0,0 +1,29 @@
+"""add last_full_scrape_at to sources
+
+Revision ID: c3e8a1f4b6d2
+Revises: b7d2e5f8a3c1
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e8a1f4b6d2"
+down_revision: Union[str, None] = "b7d2e5f8a3c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "sources",
+        sa.Column("last_full_scrape_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("sources", "last_full_scrape_at")
@@ -0,0 +1,29 @@
+"""add blocked_requests to scrape_run_sources
+
+Revision ID: c9e4a7d2f1b8
+Revises: b6d3f9a5e2c7
+Create Date: 2026-10-17 23:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c9e4a7d2f1b8"
+down_revision: Union[str, None] = "b6d3f9a5e2c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "scrape_run_sources",
+        sa.Column("blocked_requests", sa.Integer(), server_default=sa.text("0"), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("scrape_run_sources", "blocked_requests")
@@ -0,0 +1,171 @@
+"""add canonical_url and fingerprint to jobs
+
+Revision ID: d2f8b4e6a1c3
+Revises: c1e7a9d3f5b2
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+import hashlib
+import re
+from typing import Sequence, Union
+import unicodedata
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d2f8b4e6a1c3"
+down_revision: Union[str, None] = "c1e7a9d3f5b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_BACKFILL_BATCH_SIZE = 1000
+
+# Frozen copy of app.scraper.dedupe as of this revision, so the backfill never
+# changes with (or imports) application code.
+_LOCALE_SEGMENT_RE = re.compile(r"^[a-z]{2}[-_][a-z]{2}$", re.IGNORECASE)
+_TRACKING_PARAMS = frozenset(
+    {
+        "_hsenc",
+        "_hsmi",
+        "fbclid",
+        "gclid",
+        "gh_src",
+        "iis",
+        "iisn",
+        "lever-origin",
+        "lever-source",
+        "mc_cid",
+        "mc_eid",
+        "msclkid",
+        "ref",
+        "referrer",
+        "refid",
+        "source",
+        "src",
+        "trackingid",
+        "trk",
+    }
+)
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in _TRACKING_PARAMS or name.startswith("utm_")
+
+
+def _canonicalize_url(url: str) -> str:
+    parts = urlsplit(url.strip())
+    original_scheme = parts.scheme.lower()
+    scheme = "https" if original_scheme == "http" else original_scheme
+    host = (parts.hostname or "").lower().removeprefix("www.")
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port is not None and port != _DEFAULT_PORTS.get(original_scheme):
+        host = f"{host}:{port}"
+    segments = [
+        segment
+        for segment in parts.path.split("/")
+        if segment and not _LOCALE_SEGMENT_RE.match(segment)
+    ]
+    path = "/" + "/".join(segments)
+    params = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(name)
+    ]
+    query = urlencode(sorted(params))
+    fragment = parts.fragment if parts.fragment.startswith(("/", "!")) else ""
+    return urlunsplit((scheme, host, path, query, fragment))
+
+
+def _normalize_text(value: str | None) -> str:
+    text = unicodedata.normalize("NFKC", value or "").casefold()
+    return " ".join(_NON_WORD_RE.sub(" ", text).split())
+
+
+def _job_fingerprint(title: str, company: str, location: str | None) -> str | None:
+    parts = [_normalize_text(value) for value in (title, company, location)]
+    if not parts[2]:
+        return None
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+
+def upgrade() -> None:
+    op.add_column("jobs", sa.Column("canonical_url", sa.Text(), nullable=True))
+    op.add_column("jobs", sa.Column("fingerprint", sa.String(length=64), nullable=True))
+
+    if context.is_offline_mode():
+        # The backfill reads rows, which --sql output can't do; existing jobs
+        # keep NULL keys and are only matched by their exact URL.
+        _create_indexes()
+        return
+
+    # Backfill existing rows in id order, one batch at a time.
+    jobs = sa.table(
+        "jobs",
+        sa.column("id", sa.Integer()),
+        sa.column("url", sa.Text()),
+        sa.column("title", sa.String()),
+        sa.column("company", sa.String()),
+        sa.column("location", sa.String()),
+        sa.column("canonical_url", sa.Text()),
+        sa.column("fingerprint", sa.String()),
+    )
+    bind = op.get_bind()
+    set_keys = (
+        jobs.update()
+        .where(jobs.c.id == sa.bindparam("job_id"))
+        .values(
+            canonical_url=sa.bindparam("new_canonical_url"),
+            fingerprint=sa.bindparam("new_fingerprint"),
+        )
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(jobs.c.id, jobs.c.url, jobs.c.title, jobs.c.company, jobs.c.location)
+            .where(jobs.c.id > last_id)
+            .order_by(jobs.c.id)
+            .limit(_BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            set_keys,
+            [
+                {
+                    "job_id": row.id,
+                    "new_canonical_url": _canonicalize_url(row.url),
+                    "new_fingerprint": _job_fingerprint(row.title, row.company, row.location),
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+    _create_indexes()
+
+
+def _create_indexes() -> None:
+    op.create_index(
+        "ix_jobs_canonical_url",
+        "jobs",
+        ["canonical_url"],
+        unique=False,
+        postgresql_using="hash",
+    )
+    op.create_index("ix_jobs_fingerprint", "jobs", ["fingerprint"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_fingerprint", table_name="jobs")
+    op.drop_index("ix_jobs_canonical_url", table_name="jobs")
+    op.drop_column("jobs", "fingerprint")
+    op.drop_column("jobs", "canonical_url")
@@ -0,0 +1,71 @@
+"""add scrape_runs tables
+
+Revision ID: d4f1b9c7e2a5
+Revises: c3e8a1f4b6d2
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4f1b9c7e2a5"
+down_revision: Union[str, None] = "c3e8a1f4b6d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+scrape_run_status = postgresql.ENUM(
+    "PENDING", "RUNNING", "COMPLETED", "FAILED", name="scraperunstatus", create_type=False
+)
+
+
+def upgrade() -> None:
+    scrape_run_status.create(op.get_bind(), checkfirst=True)
+    op.create_table(
+        "scrape_runs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("status", scrape_run_status, nullable=False),
+        sa.Column("sources_processed", sa.Integer(), nullable=False),
+        sa.Column("jobs_found", sa.Integer(), nullable=False),
+        sa.Column("jobs_new", sa.Integer(), nullable=False),
+        sa.Column("errors", sa.JSON(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "scrape_run_sources",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("run_id", sa.Integer(), nullable=False),
+        sa.Column("source_id", sa.Integer(), nullable=True),
+        sa.Column("source_name", sa.String(length=256), nullable=False),
+        sa.Column("status", scrape_run_status, nullable=False),
+        sa.Column("jobs_found", sa.Integer(), nullable=False),
+        sa.Column("jobs_new", sa.Integer(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["run_id"], ["scrape_runs.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["source_id"], ["sources.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_scrape_run_sources_run_id", "scrape_run_sources", ["run_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_scrape_run_sources_run_id", table_name="scrape_run_sources")
+    op.drop_table("scrape_run_sources")
+    op.drop_table("scrape_runs")
+    scrape_run_status.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,30 @@
+"""add scrape_interval_minutes and next_scrape_at to sources
+
+Revision ID: e3a9c5f7b2d4
+Revises: d2f8b4e6a1c3
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e3a9c5f7b2d4"
+down_revision: Union[str, None] = "d2f8b4e6a1c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("sources", sa.Column("scrape_interval_minutes", sa.Integer(), nullable=True))
+    op.add_column(
+        "sources", sa.Column("next_scrape_at", sa.DateTime(timezone=True), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("sources", "next_scrape_at")
+    op.drop_column("sources", "scrape_interval_minutes")
@@ -0,0 +1,29 @@
+"""add jobs recency indexes
+
+Revision ID: e5a2c8d1f7b3
+Revises: d4f1b9c7e2a5
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a2c8d1f7b3"
+down_revision: Union[str, None] = "d4f1b9c7e2a5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_jobs_scraped_at_id", "jobs", ["scraped_at", "id"], unique=False)
+    op.create_index(
+        "ix_jobs_status_scraped_at_id", "jobs", ["status", "scraped_at", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_status_scraped_at_id", table_name="jobs")
+    op.drop_index("ix_jobs_scraped_at_id", table_name="jobs")
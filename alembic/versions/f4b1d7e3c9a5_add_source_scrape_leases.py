@@ -0,0 +1,30 @@
+"""add scheduler lease columns to sources
+
+Revision ID: f4b1d7e3c9a5
+Revises: e3a9c5f7b2d4
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f4b1d7e3c9a5"
+down_revision: Union[str, None] = "e3a9c5f7b2d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("sources", sa.Column("lease_owner", sa.String(length=128), nullable=True))
+    op.add_column(
+        "sources", sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("sources", "lease_expires_at")
+    op.drop_column("sources", "lease_owner")
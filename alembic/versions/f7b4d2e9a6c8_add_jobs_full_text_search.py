@@ -0,0 +1,57 @@
+"""add jobs full-text search
+
+Revision ID: f7b4d2e9a6c8
+Revises: e5a2c8d1f7b3
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f7b4d2e9a6c8"
+down_revision: Union[str, None] = "e5a2c8d1f7b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Kept in sync with app.models.JOB_SEARCH_VECTOR_SQL at the time of writing.
+_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(company, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(location, '')), 'C') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'D')"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        "jobs",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(_SEARCH_VECTOR_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_jobs_search_vector", "jobs", ["search_vector"], unique=False, postgresql_using="gin"
+    )
+    op.create_index(
+        "ix_jobs_title_trgm",
+        "jobs",
+        ["title"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_title_trgm", table_name="jobs")
+    op.drop_index("ix_jobs_search_vector", table_name="jobs")
+    op.drop_column("jobs", "search_vector")
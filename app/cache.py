@@ -0,0 +1,97 @@
+"""ETag support and an in-process response cache for listing endpoints.
+
+Each listing depends on one or more change scopes ("jobs", "sources") whose
+versions live in the `change_versions` table and are bumped in the same
+transaction as the writes (see `app.database.mark_changed`). The ETag is derived from those
+versions, so a matching `If-None-Match` gets a `304` without running the
+listing query, and cached bodies are reused until a version moves.
+"""
+
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import ChangeVersion
+
+JOBS_SCOPE = "jobs"
+SOURCES_SCOPE = "sources"
+
+
+class ResponseCache:
+    """Small LRU of serialized listing bodies, each tagged with the ETag it was built for."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+
+    def get(self, key: str, etag: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] != etag:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: str, etag: str, body: bytes) -> None:
+        if self._max_entries <= 0:
+            return
+        self._entries[key] = (etag, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+response_cache = ResponseCache(settings.response_cache_max_entries)
+
+
+async def current_etag(db: AsyncSession, scopes: tuple[str, ...]) -> str:
+    result = await db.execute(
+        select(ChangeVersion.name, ChangeVersion.version).where(ChangeVersion.name.in_(scopes))
+    )
+    versions = dict(result.tuples().all())
+    return 'W/"' + ".".join(str(versions.get(scope, 0)) for scope in scopes) + '"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip() for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+async def cached_listing(
+    request: Request,
+    db: AsyncSession,
+    scopes: tuple[str, ...],
+    build: Callable[[], Awaitable[BaseModel | bytes]],
+) -> Response:
+    """Serve a listing with ETag/304 support, reusing cached bodies for the same query.
+
+    `build` returns either a response model or an already serialized JSON body.
+    """
+    # Read the version before the data: a write that lands in between only
+    # makes the cached body newer than its tag, never older.
+    etag = await current_etag(db, scopes)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    key = f"{request.url.path}?{urlencode(sorted(request.query_params.multi_items()))}"
+    body = response_cache.get(key, etag)
+    if body is None:
+        built = await build()
+        body = built if isinstance(built, bytes) else built.model_dump_json().encode()
+        response_cache.put(key, etag, body)
+    return Response(content=body, media_type="application/json", headers=headers)
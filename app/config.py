@@ -13,6 +13,12 @@ class Settings(BaseSettings):
     # Database
     database_url: str
     database_sync_url: str
+    # Connection pools: API requests and background scraping use separate
+    # engines so a running scrape cannot starve request handlers.
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    scrape_db_pool_size: int = 4
+    scrape_db_max_overflow: int = 4
 
     # Application
     app_env: str = "development"
@@ -24,7 +30,47 @@ class Settings(BaseSettings):
     # Scraper
     playwright_headless: bool = True
     scraper_timeout_seconds: int = 30
-    scraper_delay_seconds: int = 2
+    scraper_delay_seconds: float = 2
+    scraper_host_burst: int = 1
+    scraper_host_rate_overrides: dict[str, tuple[float, int]] = {}
+    scraper_max_concurrency: int = 1
+    scraper_max_per_host: int = 1
+    scraper_resource_profile: str = "full"
+    scraper_incremental: bool = False
+    scraper_known_pages_to_stop: int = 2
+    scraper_full_sweep_hours: int = 24
+    scheduler_jitter_ratio: float = 0.1
+    scheduler_adaptive: bool = True
+    scheduler_min_interval_minutes: int = 15
+    scheduler_max_interval_minutes: int = 1440
+    scheduler_target_new_jobs: float = 2.0
+    scheduler_lease_seconds: int = 900
+    scheduler_resync_seconds: int = 60
+
+    # Scrape worker: with SCRAPE_WORKER_EMBEDDED the API process runs the
+    # scheduler and submitted runs itself; otherwise `python -m app.worker` does.
+    scrape_worker_embedded: bool = True
+    worker_poll_seconds: float = 2.0
+    worker_processes: int = 0
+
+    # Workday pagination
+    workday_page_size: int = 20
+    workday_page_concurrency: int = 1
+
+    # Shared HTTP client pool
+    http_pool_max_connections: int = 100
+    http_pool_max_keepalive: int = 20
+    http_pool_keepalive_expiry_seconds: float = 30.0
+    http_pool_max_per_host: int = 6
+    http_pool_http2: bool = False
+
+    # Shared Chromium pool
+    browser_pool_max_contexts: int = 4
+    browser_pool_recycle_after_pages: int = 200
+    browser_pool_max_rss_mb: int = 0
+
+    # Listing response cache
+    response_cache_max_entries: int = 256
 
     # Logging
     log_file_path: str = "logs/req-hunter.log"
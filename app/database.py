@@ -1,7 +1,8 @@
-"""Async SQLAlchemy engine, session factory, and declarative Base."""
+"""Async SQLAlchemy engines, session factories, and declarative Base."""
 
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -15,6 +16,8 @@ engine = create_async_engine(
     settings.database_url,
     echo=settings.app_debug,
     pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -23,17 +26,70 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Background scraping (runs, scheduler) gets its own pool so it never competes
+# with API requests for connections. Every in-flight source scrape holds one
+# connection, plus a few for scheduler and run-queue bookkeeping.
+_SCRAPE_BOOKKEEPING_CONNECTIONS = 2
+
+scrape_engine = create_async_engine(
+    settings.database_url,
+    echo=settings.app_debug,
+    pool_pre_ping=True,
+    pool_size=max(
+        settings.scrape_db_pool_size,
+        settings.scraper_max_concurrency + _SCRAPE_BOOKKEEPING_CONNECTIONS,
+    ),
+    max_overflow=settings.scrape_db_max_overflow,
+)
+
+ScrapeSessionLocal = async_sessionmaker(
+    bind=scrape_engine,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+
+_CHANGED_SCOPES_KEY = "changed_scopes"
+
+_BUMP_VERSION_SQL = text(
+    "INSERT INTO change_versions (name, version) VALUES (:name, 1) "
+    "ON CONFLICT (name) DO UPDATE SET version = change_versions.version + 1"
+)
+
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy ORM models."""
 
 
+def mark_changed(db: AsyncSession, *scopes: str) -> None:
+    """Record that this session's transaction changes data in the given scopes.
+
+    The scopes' change versions (used for listing ETags) are bumped by
+    `commit_and_publish` as part of the same transaction.
+    """
+    db.info.setdefault(_CHANGED_SCOPES_KEY, set()).update(scopes)
+
+
+async def commit_and_publish(db: AsyncSession) -> None:
+    """Bump the change version of every scope marked as changed, then commit.
+
+    The bump is part of the data's own transaction, so new data and its new
+    versions become visible together and a failed commit leaves neither. The
+    version rows are locked only from the bump to the commit.
+    """
+    scopes = db.info.pop(_CHANGED_SCOPES_KEY, None)
+    if scopes:
+        # Sorted so concurrent publishers lock version rows in the same order.
+        await db.execute(_BUMP_VERSION_SQL, [{"name": scope} for scope in sorted(scopes)])
+    await db.commit()
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """FastAPI dependency that provides a database session per request."""
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            await commit_and_publish(session)
         except Exception:
             await session.rollback()
             raise
@@ -13,8 +13,11 @@ from starlette.responses import JSONResponse
 
 from app.config import settings
 from app.logging_utils import configure_logging
-from app.routers import jobs, logs, schedule, scrape, sources
+from app.routers import jobs, logs, schedule, scrape, sources, stats
 from app.scheduler import scrape_scheduler
+from app.scraper.browser_pool import browser_pool
+from app.scraper.http_pool import http_pool
+from app.scraper.runs import run_queue
 
 _STATIC_DIR = Path(__file__).parent / "static"
 logger = logging.getLogger(__name__)
@@ -24,12 +27,18 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     configure_logging()
     logger.info("Starting req-hunter in %s mode", settings.app_env)
-    await scrape_scheduler.start()
+    if settings.scrape_worker_embedded:
+        await scrape_scheduler.start()
+        await run_queue.start()
     yield
-    from app.database import engine
+    from app.database import engine, scrape_engine
 
     await scrape_scheduler.stop()
+    await run_queue.stop()
     logger.info("Shutting down req-hunter")
+    await browser_pool.close()
+    await http_pool.close()
+    await scrape_engine.dispose()
     await engine.dispose()
 
 
@@ -53,6 +62,7 @@ app.include_router(sources.router, prefix="/api/v1")
 app.include_router(scrape.router, prefix="/api/v1")
 app.include_router(logs.router, prefix="/api/v1")
 app.include_router(schedule.router, prefix="/api/v1")
+app.include_router(stats.router, prefix="/api/v1")
 
 
 @app.exception_handler(Exception)
@@ -1,14 +1,39 @@
 """SQLAlchemy ORM models for req-hunter."""
 
 import enum
-from datetime import datetime
+from datetime import date, datetime
 
-from sqlalchemy import Boolean, DateTime, Enum, String, Text, func
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    Computed,
+    Date,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
 
+# Weighted full-text document for job search: title ranks above company,
+# company above location, location above description.
+JOB_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(company, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(location, '')), 'C') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'D')"
+)
+
+
 class JobStatus(str, enum.Enum):
     NEW = "new"
     SEEN = "seen"
@@ -17,18 +42,56 @@ class JobStatus(str, enum.Enum):
     IGNORED = "ignored"
 
 
+class ScrapeRunStatus(str, enum.Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 class Job(Base):
     """Represents a single job listing scraped from an external source."""
 
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Keyset pagination for GET /jobs orders by (scraped_at, id) descending,
+        # optionally within a status.
+        Index("ix_jobs_scraped_at_id", "scraped_at", "id"),
+        Index("ix_jobs_status_scraped_at_id", "status", "scraped_at", "id"),
+        Index("ix_jobs_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_jobs_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index("ix_jobs_source_id_scraped_at_id", "source_id", "scraped_at", "id"),
+        Index("ix_jobs_company", "company"),
+        # Serves case-insensitive substring filters on location (ILIKE '%...%').
+        Index(
+            "ix_jobs_location_trgm",
+            "location",
+            postgresql_using="gin",
+            postgresql_ops={"location": "gin_trgm_ops"},
+        ),
+        # Near-duplicate lookups at ingest (see app.scraper.dedupe). Hash, not
+        # btree, so arbitrarily long URLs can be indexed.
+        Index("ix_jobs_canonical_url", "canonical_url", postgresql_using="hash"),
+        Index("ix_jobs_fingerprint", "fingerprint"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(512), nullable=False)
     company: Mapped[str] = mapped_column(String(256), nullable=False)
     location: Mapped[str | None] = mapped_column(String(256), nullable=True)
     url: Mapped[str] = mapped_column(Text, nullable=False, unique=True)
+    canonical_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     source: Mapped[str] = mapped_column(String(128), nullable=False)
+    source_id: Mapped[int | None] = mapped_column(
+        ForeignKey("sources.id", ondelete="SET NULL"), nullable=True
+    )
     status: Mapped[JobStatus] = mapped_column(
         Enum(JobStatus), default=JobStatus.NEW, nullable=False
     )
@@ -43,6 +106,11 @@ class Job(Base):
         onupdate=func.now(),
         nullable=False,
     )
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(JOB_SEARCH_VECTOR_SQL, persisted=True),
+        deferred=True,
+    )
 
 
 class Source(Base):
@@ -56,6 +124,8 @@ class Source(Base):
     keyword: Mapped[str] = mapped_column(String(256), nullable=False)
     query_param: Mapped[str] = mapped_column(String(64), default="q", nullable=False)
     url_path_filter: Mapped[str | None] = mapped_column(String(256), nullable=True)
+    resource_profile: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    scrape_interval_minutes: Mapped[int | None] = mapped_column(nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_blocked: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     blocked_reason: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -64,6 +134,22 @@ class Source(Base):
     last_scraped_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    last_full_scrape_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    next_scrape_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Adaptive scheduling state, updated after each scheduled run.
+    current_interval_minutes: Mapped[int | None] = mapped_column(nullable=True)
+    interval_reason: Mapped[str | None] = mapped_column(String(256), nullable=True)
+    new_jobs_per_hour: Mapped[float | None] = mapped_column(Float, nullable=True)
+    consecutive_failures: Mapped[int] = mapped_column(default=0, nullable=False)
+    # Scheduler lease: the process scraping this source, until the lease expires.
+    lease_owner: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -89,3 +175,85 @@ class ScrapeSchedule(Base):
         onupdate=func.now(),
         nullable=False,
     )
+
+
+class ScrapeRun(Base):
+    """A scrape run submitted through the API, executed by a run queue."""
+
+    __tablename__ = "scrape_runs"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    status: Mapped[ScrapeRunStatus] = mapped_column(
+        Enum(ScrapeRunStatus), default=ScrapeRunStatus.PENDING, nullable=False
+    )
+    sources_processed: Mapped[int] = mapped_column(default=0, nullable=False)
+    jobs_found: Mapped[int] = mapped_column(default=0, nullable=False)
+    jobs_new: Mapped[int] = mapped_column(default=0, nullable=False)
+    errors: Mapped[list[str]] = mapped_column(JSON, default=list, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Lease held by the process executing the run, until the lease expires.
+    lease_owner: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    sources: Mapped[list["ScrapeRunSource"]] = relationship(
+        back_populates="run",
+        order_by="ScrapeRunSource.id",
+        lazy="selectin",
+        cascade="all, delete-orphan",
+    )
+
+
+class ScrapeRunSource(Base):
+    """Progress of one source within a scrape run."""
+
+    __tablename__ = "scrape_run_sources"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    run_id: Mapped[int] = mapped_column(
+        ForeignKey("scrape_runs.id", ondelete="CASCADE"), index=True, nullable=False
+    )
+    source_id: Mapped[int | None] = mapped_column(
+        ForeignKey("sources.id", ondelete="SET NULL"), nullable=True
+    )
+    source_name: Mapped[str] = mapped_column(String(256), nullable=False)
+    status: Mapped[ScrapeRunStatus] = mapped_column(
+        Enum(ScrapeRunStatus), default=ScrapeRunStatus.PENDING, nullable=False
+    )
+    jobs_found: Mapped[int] = mapped_column(default=0, nullable=False)
+    jobs_new: Mapped[int] = mapped_column(default=0, nullable=False)
+    blocked_requests: Mapped[int] = mapped_column(default=0, nullable=False)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    run: Mapped[ScrapeRun] = relationship(back_populates="sources")
+
+
+class ChangeVersion(Base):
+    """Monotonic per-scope counter bumped after committed changes (e.g. "jobs")."""
+
+    __tablename__ = "change_versions"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+
+
+class JobDailyStat(Base):
+    """Rollup of job counts per source, scrape day (UTC) and status.
+
+    Maintained incrementally by ingestion and status updates (see `app.stats`).
+    `source_id` is 0 for jobs without a source, so it is not a foreign key.
+    """
+
+    __tablename__ = "job_daily_stats"
+
+    source_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    status: Mapped[JobStatus] = mapped_column(Enum(JobStatus), primary_key=True)
+    job_count: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
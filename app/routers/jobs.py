@@ -1,36 +1,353 @@
 """Job listing CRUD endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, select
+import base64
+from collections.abc import AsyncIterator
+import csv
+from datetime import datetime
+import io
+from itertools import chain
+import json
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    Text,
+    cast,
+    func,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.expression import ClauseElement, Executable
 
-from app.database import get_db
+from app.cache import JOBS_SCOPE, cached_listing
+from app.database import AsyncSessionLocal, get_db, mark_changed
 from app.models import Job, JobStatus
-from app.schemas import JobListResponse, JobRead, JobUpdate
+from app.schemas import (
+    JobBulkUpdate,
+    JobBulkUpdateResult,
+    JobFilter,
+    JobListResponse,
+    JobRead,
+    JobUpdate,
+)
+from app.stats import record_status_changes
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 
+# Each listed job rendered to JSON by Postgres, with JobRead's fields in
+# JobRead's order. Statuses are stored by enum name and lower-cased to the
+# API's values; keys are SQL literals so asyncpg need not infer their types.
+_JOB_READ_COLUMNS = (
+    ("title", Job.title),
+    ("company", Job.company),
+    ("location", Job.location),
+    ("url", Job.url),
+    ("description", Job.description),
+    ("source", Job.source),
+    ("id", Job.id),
+    ("source_id", Job.source_id),
+    ("status", func.lower(cast(Job.status, Text))),
+    ("scraped_at", Job.scraped_at),
+    ("updated_at", Job.updated_at),
+)
+_JOB_JSON = cast(
+    func.json_build_object(
+        *chain.from_iterable(
+            (literal_column(f"'{name}'"), column) for name, column in _JOB_READ_COLUMNS
+        )
+    ),
+    Text,
+)
+
+
+def _encode_cursor(scraped_at: datetime, job_id: int) -> str:
+    raw = json.dumps([scraped_at.isoformat(), job_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        scraped_at, job_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(scraped_at), int(job_id)
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+def _filter_conditions(filters: JobFilter) -> list[ColumnElement[bool]]:
+    conditions: list[ColumnElement[bool]] = []
+    if filters.status:
+        conditions.append(Job.status == filters.status)
+    if filters.source_id is not None:
+        conditions.append(Job.source_id == filters.source_id)
+    if filters.company:
+        conditions.append(Job.company == filters.company)
+    if filters.location:
+        pattern = f"%{_escape_like(filters.location)}%"
+        conditions.append(Job.location.ilike(pattern, escape="/"))
+    if filters.scraped_after is not None:
+        conditions.append(Job.scraped_at >= filters.scraped_after)
+    if filters.scraped_before is not None:
+        conditions.append(Job.scraped_at < filters.scraped_before)
+    return conditions
+
+
+def _search_clause(
+    q: str, fuzzy: bool
+) -> tuple[ColumnElement[bool], ColumnElement[float]]:
+    """Return (match condition, relevance rank) for a full-text query."""
+    ts_query = func.websearch_to_tsquery("english", q)
+    rank = func.ts_rank(Job.search_vector, ts_query)
+    match = Job.search_vector.op("@@")(ts_query)
+    if fuzzy:
+        match = or_(match, Job.title.op("%")(q))
+        rank = func.greatest(rank, func.similarity(Job.title, q))
+    return match, rank
+
+
+class _Explain(Executable, ClauseElement):
+    """`EXPLAIN (FORMAT JSON)` of a statement, executed with its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain)
+def _compile_explain(element: _Explain, compiler: SQLCompiler, **kw: object) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def _estimate_count(db: AsyncSession, query: Select) -> int:
+    """Return the planner's row estimate for `query` instead of counting rows."""
+    plan = await db.scalar(_Explain(query))
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def job_filter_params(
+    status: JobStatus | None = Query(None, description="Filter by job status"),
+    source_id: int | None = Query(None, description="Filter by source ID"),
+    company: str | None = Query(None, description="Filter by exact company name"),
+    location: str | None = Query(None, description="Case-insensitive location substring"),
+    scraped_after: datetime | None = Query(None, description="Only jobs scraped at/after this"),
+    scraped_before: datetime | None = Query(None, description="Only jobs scraped before this"),
+) -> JobFilter:
+    """FastAPI dependency collecting the job filter query parameters."""
+    return JobFilter(
+        status=status,
+        source_id=source_id,
+        company=company,
+        location=location,
+        scraped_after=scraped_after,
+        scraped_before=scraped_before,
+    )
+
+
 @router.get("/", response_model=JobListResponse)
 async def list_jobs(
-    status: JobStatus | None = Query(None, description="Filter by job status"),
+    request: Request,
+    filters: JobFilter = Depends(job_filter_params),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(
+        None, description="Opaque cursor from a previous page's next_cursor"
+    ),
+    count: Literal["exact", "estimated", "none"] = Query(
+        "exact", description="How to compute total: exact count, planner estimate, or skip"
+    ),
+    q: str | None = Query(
+        None, description="Full-text search over title, company, location and description"
+    ),
+    fuzzy: bool = Query(False, description="With q, also match titles by trigram similarity"),
     db: AsyncSession = Depends(get_db),
-) -> JobListResponse:
-    """Return a paginated list of scraped job listings."""
-    query = select(Job)
-    count_query = select(func.count()).select_from(Job)
+) -> Response:
+    """Return a page of scraped job listings, newest first.
+
+    Pass `cursor` (from `next_cursor`) for keyset pagination; `offset` is
+    still honoured when no cursor is given. With `q`, results are ranked by
+    relevance instead and paginated by offset only. Responses carry an ETag
+    and honour `If-None-Match`.
+    """
+    q = q.strip() if q else None
+    if q and cursor:
+        raise HTTPException(status_code=400, detail="cursor cannot be combined with q")
+    after = _decode_cursor(cursor) if cursor else None
+
+    async def build() -> bytes:
+        conditions = _filter_conditions(filters)
+        rank = None
+        if q:
+            match, rank = _search_clause(q, fuzzy)
+            conditions.append(match)
+
+        query = select(Job).where(*conditions)
+        count_query = select(func.count()).select_from(Job).where(*conditions)
+
+        if count == "exact":
+            total = await db.scalar(count_query)
+        elif count == "estimated":
+            total = await _estimate_count(db, query)
+        else:
+            total = None
+
+        ordering = [Job.scraped_at.desc(), Job.id.desc()]
+        if rank is not None:
+            ordering.insert(0, rank.desc())
+        page_query = query.order_by(*ordering).limit(limit)
+        if after is not None:
+            page_query = page_query.where(tuple_(Job.scraped_at, Job.id) < after)
+        else:
+            page_query = page_query.offset(offset)
+
+        # Fast path: no ORM objects or JobRead validation; the items are
+        # spliced into the body exactly as Postgres rendered them.
+        result = await db.execute(page_query.with_only_columns(_JOB_JSON, Job.scraped_at, Job.id))
+        rows = result.tuples().all()
+        next_cursor = None
+        if rank is None and len(rows) == limit:
+            _, last_scraped_at, last_id = rows[-1]
+            next_cursor = _encode_cursor(last_scraped_at, last_id)
+
+        items = ",".join(item for item, _, _ in rows)
+        return (
+            f'{{"total":{json.dumps(total)},"items":[{items}],'
+            f'"next_cursor":{json.dumps(next_cursor)}}}'
+        ).encode()
+
+    return await cached_listing(request, db, (JOBS_SCOPE,), build)
+
 
-    if status:
-        query = query.where(Job.status == status)
-        count_query = count_query.where(Job.status == status)
+_EXPORT_COLUMNS = (
+    Job.id,
+    Job.title,
+    Job.company,
+    Job.location,
+    Job.url,
+    Job.description,
+    Job.source,
+    Job.source_id,
+    Job.status,
+    Job.scraped_at,
+    Job.updated_at,
+)
+_EXPORT_BATCH_SIZE = 1000
 
-    total = await db.scalar(count_query)
-    result = await db.execute(query.offset(offset).limit(limit))
-    jobs = result.scalars().all()
 
-    return JobListResponse(total=total or 0, items=list(jobs))
+def _export_value(value: object) -> object:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, JobStatus):
+        return value.value
+    return value
+
+
+async def _stream_export(query: Select, fmt: str) -> AsyncIterator[str]:
+    """Yield the export chunk by chunk from a server-side cursor.
+
+    Runs on its own session: the request's `get_db` session is closed before
+    a streaming body is sent.
+    """
+    names = [column.key for column in _EXPORT_COLUMNS]
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(names)
+        yield buffer.getvalue()
+
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=_EXPORT_BATCH_SIZE))
+        async for rows in result.partitions():
+            if fmt == "csv":
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                writer.writerows([_export_value(v) for v in row] for row in rows)
+                yield buffer.getvalue()
+            else:
+                yield "".join(
+                    json.dumps(dict(zip(names, map(_export_value, row), strict=True))) + "\n"
+                    for row in rows
+                )
+
+
+@router.get("/export")
+async def export_jobs(
+    filters: JobFilter = Depends(job_filter_params),
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Output format"),
+    q: str | None = Query(
+        None, description="Full-text search over title, company, location and description"
+    ),
+    fuzzy: bool = Query(False, description="With q, also match titles by trigram similarity"),
+) -> StreamingResponse:
+    """Stream every job matching the filters as NDJSON or CSV, newest first."""
+    query = select(*_EXPORT_COLUMNS).where(*_filter_conditions(filters))
+    q = q.strip() if q else None
+    if q:
+        match, _ = _search_clause(q, fuzzy)
+        query = query.where(match)
+    query = query.order_by(Job.scraped_at.desc(), Job.id.desc())
+
+    if format == "csv":
+        media_type, filename = "text/csv", "jobs.csv"
+    else:
+        media_type, filename = "application/x-ndjson", "jobs.ndjson"
+    return StreamingResponse(
+        _stream_export(query, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post("/bulk-status", response_model=JobBulkUpdateResult)
+async def bulk_update_job_status(
+    payload: JobBulkUpdate,
+    db: AsyncSession = Depends(get_db),
+) -> JobBulkUpdateResult:
+    """Set the status of many jobs in one UPDATE, selected by `ids` or `filter`."""
+    if payload.ids is not None:
+        conditions = [Job.id.in_(payload.ids)]
+    else:
+        conditions = _filter_conditions(payload.filter)
+    # UPDATE ... FROM a locked snapshot of the matching rows, so RETURNING can
+    # report each job's previous status for the statistics rollups.
+    previous = (
+        select(Job.id, Job.status).where(*conditions).with_for_update().subquery("previous")
+    )
+    result = await db.execute(
+        update(Job)
+        .where(Job.id == previous.c.id)
+        .values(status=payload.status)
+        .returning(Job.id, Job.source_id, Job.scraped_at, previous.c.status)
+        .execution_options(synchronize_session=False)
+    )
+    rows = result.tuples().all()
+    await record_status_changes(
+        db,
+        [
+            (source_id, scraped_at, old_status, payload.status)
+            for _, source_id, scraped_at, old_status in rows
+        ],
+    )
+    ids = [job_id for job_id, _, _, _ in rows]
+    if ids:
+        mark_changed(db, JOBS_SCOPE)
+    return JobBulkUpdateResult(updated=len(ids), ids=ids)
 
 
 @router.get("/{job_id}", response_model=JobRead)
@@ -49,10 +366,14 @@ async def update_job_status(
     db: AsyncSession = Depends(get_db),
 ) -> Job:
     """Update a job's status (e.g., mark as applied or ignored)."""
-    job = await db.get(Job, job_id)
+    # Locked so concurrent updates of the same job serialize and each one
+    # records the status it actually replaced in the statistics rollups.
+    job = await db.get(Job, job_id, with_for_update=True)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
+    await record_status_changes(db, [(job.source_id, job.scraped_at, job.status, payload.status)])
     job.status = payload.status
+    mark_changed(db, JOBS_SCOPE)
     await db.flush()
     await db.refresh(job)
     return job
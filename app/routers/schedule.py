@@ -1,17 +1,11 @@
 """Scheduler configuration endpoints."""
 
-from datetime import datetime, timezone
-
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.schemas import ScheduleRead, ScheduleUpdate
-from app.scheduler import (
-    calculate_next_run,
-    ensure_schedule_row,
-    normalize_interval,
-)
+from app.scheduler import ensure_schedule_row, normalize_interval, scrape_scheduler
 
 router = APIRouter(prefix="/schedule", tags=["schedule"])
 
@@ -25,10 +19,10 @@ async def get_schedule(db: AsyncSession = Depends(get_db)) -> ScheduleRead:
 @router.patch("/", response_model=ScheduleRead)
 async def update_schedule(
     payload: ScheduleUpdate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ) -> ScheduleRead:
     schedule = await ensure_schedule_row(db)
-    now_utc = datetime.now(timezone.utc)
 
     if payload.interval_minutes is not None:
         schedule.interval_minutes = normalize_interval(payload.interval_minutes)
@@ -36,14 +30,12 @@ async def update_schedule(
     if payload.is_enabled is not None:
         schedule.is_enabled = payload.is_enabled
 
-    if schedule.is_enabled:
-        schedule.next_run_at = calculate_next_run(
-            now_utc=now_utc,
-            interval_minutes=schedule.interval_minutes,
-        )
-    else:
+    if not schedule.is_enabled:
         schedule.next_run_at = None
 
+    # next_run_at is derived from the sources' due times; the scheduler
+    # recomputes it once this commits.
+    background_tasks.add_task(scrape_scheduler.wake)
     await db.flush()
     await db.refresh(schedule)
     return ScheduleRead.model_validate(schedule)
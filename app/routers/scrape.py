@@ -1,35 +1,78 @@
-"""Endpoints for triggering scraper runs."""
+"""Endpoints for triggering scraper runs.
 
-from fastapi import APIRouter, Depends, HTTPException
+Runs are executed in the background: the trigger endpoints enqueue a pending
+run and return it immediately, a run queue (in this process or in
+`app.worker`) picks it up, and clients poll `GET /scrape/runs/{id}` for
+progress.
+"""
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.models import Source
-from app.schemas import ScrapeResult
-from app.scraper.runner import run_all_sources, run_source
+from app.models import ScrapeRun, Source
+from app.schemas import HttpPoolStats, ScrapeRunListResponse, ScrapeRunRead
+from app.scraper.http_pool import http_pool
+from app.scraper.runs import create_run, run_queue
 
 router = APIRouter(prefix="/scrape", tags=["scrape"])
 
 
-@router.post("/run", response_model=ScrapeResult)
-async def scrape_all(db: AsyncSession = Depends(get_db)) -> ScrapeResult:
-    """Trigger a scrape run across all active sources."""
-    return await run_all_sources(db)
+async def _submit(
+    sources: list[Source], db: AsyncSession, background_tasks: BackgroundTasks
+) -> ScrapeRun:
+    run = await create_run(db, sources)
+    # Runs after the request's transaction commits, so the run is visible.
+    background_tasks.add_task(run_queue.wake)
+    return run
+
+
+@router.post("/run", response_model=ScrapeRunRead, status_code=202)
+async def scrape_all(
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+) -> ScrapeRun:
+    """Submit a background scrape run across all active sources."""
+    result = await db.execute(select(Source).where(Source.is_active.is_(True)))
+    return await _submit(list(result.scalars().all()), db, background_tasks)
 
 
-@router.post("/run/{source_id}", response_model=ScrapeResult)
+@router.post("/run/{source_id}", response_model=ScrapeRunRead, status_code=202)
 async def scrape_one(
     source_id: int,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
-) -> ScrapeResult:
-    """Trigger a scrape run for a single source by ID."""
+) -> ScrapeRun:
+    """Submit a background scrape run for a single source by ID."""
     source = await db.get(Source, source_id)
     if not source:
         raise HTTPException(status_code=404, detail="Source not found")
-    found, new, errors = await run_source(source, db)
-    return ScrapeResult(
-        sources_processed=1,
-        jobs_found=found,
-        jobs_new=new,
-        errors=errors,
-    )
+    return await _submit([source], db, background_tasks)
+
+
+@router.get("/runs", response_model=ScrapeRunListResponse)
+async def list_runs(
+    limit: int = Query(20, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+) -> ScrapeRunListResponse:
+    """Return the most recent scrape runs."""
+    total = await db.scalar(select(func.count()).select_from(ScrapeRun))
+    result = await db.execute(select(ScrapeRun).order_by(ScrapeRun.id.desc()).limit(limit))
+    runs = result.scalars().all()
+    return ScrapeRunListResponse(total=total or 0, items=list(runs))
+
+
+@router.get("/runs/{run_id}", response_model=ScrapeRunRead)
+async def get_run(run_id: int, db: AsyncSession = Depends(get_db)) -> ScrapeRun:
+    """Return a scrape run with per-source progress."""
+    run = await db.get(ScrapeRun, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Scrape run not found")
+    return run
+
+
+@router.get("/http-pool", response_model=HttpPoolStats)
+async def http_pool_stats() -> HttpPoolStats:
+    """Return connection reuse stats for the shared scraper HTTP client."""
+    return HttpPoolStats(**http_pool.stats())
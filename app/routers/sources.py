@@ -1,33 +1,44 @@
 """Source management endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.cache import JOBS_SCOPE, SOURCES_SCOPE, cached_listing
+from app.database import get_db, mark_changed
 from app.models import Source
+from app.scheduler import scrape_scheduler
 from app.schemas import SourceCreate, SourceListResponse, SourceRead, SourceUpdate
+from app.stats import fold_source
 
 router = APIRouter(prefix="/sources", tags=["sources"])
 
 
 @router.get("/", response_model=SourceListResponse)
-async def list_sources(db: AsyncSession = Depends(get_db)) -> SourceListResponse:
-    """Return all configured scrape sources."""
-    total = await db.scalar(select(func.count()).select_from(Source))
-    result = await db.execute(select(Source).order_by(Source.created_at.desc()))
-    sources = result.scalars().all()
-    return SourceListResponse(total=total or 0, items=list(sources))
+async def list_sources(request: Request, db: AsyncSession = Depends(get_db)) -> Response:
+    """Return all configured scrape sources (with ETag / If-None-Match support)."""
+
+    async def build() -> SourceListResponse:
+        total = await db.scalar(select(func.count()).select_from(Source))
+        result = await db.execute(select(Source).order_by(Source.created_at.desc()))
+        sources = result.scalars().all()
+        return SourceListResponse(total=total or 0, items=list(sources))
+
+    return await cached_listing(request, db, (SOURCES_SCOPE,), build)
 
 
 @router.post("/", response_model=SourceRead, status_code=201)
 async def create_source(
     payload: SourceCreate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ) -> Source:
     """Add a new website to scrape with an associated keyword."""
     source = Source(**payload.model_dump())
     db.add(source)
+    mark_changed(db, SOURCES_SCOPE)
+    # Background tasks run after get_db has committed.
+    background_tasks.add_task(scrape_scheduler.wake)
     await db.flush()
     await db.refresh(source)
     return source
@@ -46,6 +57,7 @@ async def get_source(source_id: int, db: AsyncSession = Depends(get_db)) -> Sour
 async def update_source(
     source_id: int,
     payload: SourceUpdate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ) -> Source:
     """Update a source's configuration or toggle it active/inactive."""
@@ -54,6 +66,10 @@ async def update_source(
         raise HTTPException(status_code=404, detail="Source not found")
     data = payload.model_dump(exclude_none=True)
     clear_blocked = bool(data.pop("clear_blocked", False))
+    interval = data.get("scrape_interval_minutes")
+    if interval is not None and interval != source.scrape_interval_minutes:
+        # Re-spread the source over its new interval.
+        source.next_scrape_at = None
     for field, value in data.items():
         setattr(source, field, value)
     if clear_blocked:
@@ -62,16 +78,26 @@ async def update_source(
         source.blocked_at = None
         source.last_error = None
         source.is_active = True
+    mark_changed(db, SOURCES_SCOPE)
+    background_tasks.add_task(scrape_scheduler.wake)
     await db.flush()
     await db.refresh(source)
     return source
 
 
 @router.delete("/{source_id}", status_code=204)
-async def delete_source(source_id: int, db: AsyncSession = Depends(get_db)) -> None:
+async def delete_source(
+    source_id: int,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+) -> None:
     """Delete a source permanently."""
     source = await db.get(Source, source_id)
     if not source:
         raise HTTPException(status_code=404, detail="Source not found")
     await db.delete(source)
+    # Jobs from this source have their source_id cleared by the FK.
+    await fold_source(db, source_id)
+    mark_changed(db, SOURCES_SCOPE, JOBS_SCOPE)
+    background_tasks.add_task(scrape_scheduler.wake)
     await db.flush()
@@ -0,0 +1,99 @@
+"""Job statistics endpoints, served from the precomputed `job_daily_stats` rollups."""
+
+from datetime import date, datetime, timedelta, timezone
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.models import JobDailyStat, JobStatus, Source
+from app.schemas import DailyStats, DailyStatsResponse, SourceStats, StatsSummary
+from app.stats import UNATTRIBUTED_SOURCE_ID
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+
+def _empty_counts() -> dict[JobStatus, int]:
+    return {status: 0 for status in JobStatus}
+
+
+@router.get("/", response_model=StatsSummary)
+async def get_stats(
+    since: date | None = Query(None, description="First scrape day (UTC), inclusive"),
+    until: date | None = Query(None, description="Last scrape day (UTC), inclusive"),
+    db: AsyncSession = Depends(get_db),
+) -> StatsSummary:
+    """Return the job status funnel overall and per source."""
+    conditions = []
+    if since is not None:
+        conditions.append(JobDailyStat.day >= since)
+    if until is not None:
+        conditions.append(JobDailyStat.day <= until)
+    result = await db.execute(
+        select(
+            JobDailyStat.source_id,
+            Source.name,
+            JobDailyStat.status,
+            func.sum(JobDailyStat.job_count),
+        )
+        .outerjoin(Source, Source.id == JobDailyStat.source_id)
+        .where(*conditions)
+        .group_by(JobDailyStat.source_id, Source.name, JobDailyStat.status)
+    )
+
+    by_status = _empty_counts()
+    sources: dict[int, SourceStats] = {}
+    for source_id, source_name, status, count in result.tuples():
+        count = int(count)
+        if source_id not in sources:
+            sources[source_id] = SourceStats(
+                source_id=None if source_id == UNATTRIBUTED_SOURCE_ID else source_id,
+                source_name=source_name,
+                total=0,
+                by_status=_empty_counts(),
+            )
+        sources[source_id].by_status[status] += count
+        sources[source_id].total += count
+        by_status[status] += count
+
+    return StatsSummary(
+        total=sum(by_status.values()),
+        by_status=by_status,
+        sources=sorted(sources.values(), key=lambda item: item.total, reverse=True),
+    )
+
+
+@router.get("/daily", response_model=DailyStatsResponse)
+async def get_daily_stats(
+    days: int = Query(30, ge=1, le=366),
+    source_id: int | None = Query(
+        None, ge=0, description="Limit to one source (0 = jobs without a source)"
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> DailyStatsResponse:
+    """Return jobs found per scrape day (UTC) over the last `days` days, by status."""
+    today = datetime.now(timezone.utc).date()
+    first_day = today - timedelta(days=days - 1)
+    query = select(
+        JobDailyStat.day,
+        JobDailyStat.status,
+        func.sum(JobDailyStat.job_count),
+    ).where(JobDailyStat.day >= first_day)
+    if source_id is not None:
+        query = query.where(JobDailyStat.source_id == source_id)
+    result = await db.execute(query.group_by(JobDailyStat.day, JobDailyStat.status))
+
+    items = {
+        first_day + timedelta(days=offset): DailyStats(
+            day=first_day + timedelta(days=offset), total=0, by_status=_empty_counts()
+        )
+        for offset in range(days)
+    }
+    for day, status, count in result.tuples():
+        item = items.get(day)
+        if item is None:
+            continue
+        item.by_status[status] += int(count)
+        item.total += int(count)
+    return DailyStatsResponse(items=list(items.values()))
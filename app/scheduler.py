@@ -1,18 +1,49 @@
-"""Background scheduler for recurring scrape runs."""
+"""Background scheduler for recurring, per-source scrapes.
+
+Each active source is scraped every `scrape_interval_minutes` (falling back to
+the schedule's `interval_minutes`). Due times are persisted on
+`Source.next_scrape_at` and kept in an in-memory min-heap; the scheduler
+sleeps until the earliest deadline, or until `wake()` reports that sources or
+the schedule changed, instead of polling. New sources start at a random point
+within their first interval and every later run is jittered by
+`SCHEDULER_JITTER_RATIO`, so runs spread out rather than firing together.
+Between runs the interval adapts to each source's observed new-job rate and
+backs off exponentially while it keeps failing (see `adapt_interval`).
+
+Any number of processes (uvicorn workers, hosts) can run a scheduler against
+the same database. A due source is claimed with `UPDATE ... WHERE id IN
+(SELECT ... FOR UPDATE SKIP LOCKED)`, which records a lease (owner and
+expiry) on the row; the lease is renewed while the scrape runs and released
+when it finishes, and a lease left by a crashed process simply expires. The
+heap only decides when to try claiming, and is resynced from the database
+every `SCHEDULER_RESYNC_SECONDS` to see other processes' changes.
+"""
 
 import asyncio
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
+import heapq
 import logging
+import os
+import random
+import socket
+import uuid
 
-from sqlalchemy import select
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import AsyncSessionLocal
-from app.models import ScrapeSchedule
-from app.scraper.runner import run_all_sources
+from app.cache import SOURCES_SCOPE
+from app.config import settings
+from app.database import ScrapeSessionLocal, commit_and_publish, mark_changed
+from app.models import ScrapeSchedule, Source
+from app.scraper.runner import dispatch_source, source_host
 
 logger = logging.getLogger(__name__)
-_POLL_INTERVAL_SECONDS = 20
+_ERROR_RETRY_SECONDS = 20
+# Pause before retrying when due sources were all claimed by other processes.
+_CLAIM_RETRY_SECONDS = 1
+# Weight of the latest run in the smoothed new-jobs-per-hour rate.
+_RATE_SMOOTHING = 0.3
 _MIN_INTERVAL_MINUTES = 5
 
 
@@ -37,89 +68,314 @@ def normalize_interval(minutes: int) -> int:
     return max(_MIN_INTERVAL_MINUTES, minutes)
 
 
-def calculate_next_run(now_utc: datetime, interval_minutes: int) -> datetime:
-    return now_utc + timedelta(minutes=normalize_interval(interval_minutes))
+def source_interval(source: Source, schedule: ScrapeSchedule) -> timedelta:
+    """Return how often a source is scraped: its own interval or the default."""
+    minutes = source.scrape_interval_minutes or schedule.interval_minutes
+    return timedelta(minutes=normalize_interval(minutes))
+
+
+def adapt_interval(
+    source: Source,
+    schedule: ScrapeSchedule,
+    jobs_new: int,
+    failed: bool,
+    elapsed: timedelta | None = None,
+) -> tuple[int, str]:
+    """Record a scheduled run's outcome on the source and return (minutes, reason).
+
+    Failing sources back off exponentially from their base interval. Otherwise,
+    unless the source has a fixed `scrape_interval_minutes` or adaptation is
+    off, the interval targets `SCHEDULER_TARGET_NEW_JOBS` new jobs per run
+    given a smoothed new-jobs-per-hour rate, clamped to the configured bounds.
+    `elapsed` is the time since the source's previous scrape, over which
+    `jobs_new` accumulated; without it the current interval is assumed.
+    """
+    base = normalize_interval(source.scrape_interval_minutes or schedule.interval_minutes)
+    ceiling = max(base, settings.scheduler_max_interval_minutes)
+
+    if failed:
+        source.consecutive_failures += 1
+        minutes = min(base * 2**source.consecutive_failures, ceiling)
+        return minutes, f"backing off after {source.consecutive_failures} failed run(s) in a row"
+    source.consecutive_failures = 0
+
+    # Rate of the new jobs found now over the window they accumulated in.
+    if elapsed is None:
+        elapsed_hours = (source.current_interval_minutes or base) / 60
+    else:
+        elapsed_hours = max(elapsed.total_seconds() / 3600, 1 / 60)
+    observed = jobs_new / elapsed_hours
+    first_run = source.new_jobs_per_hour is None
+    if first_run:
+        # The first scrape finds the whole backlog; don't mistake it for churn.
+        source.new_jobs_per_hour = 0.0
+    else:
+        source.new_jobs_per_hour = (
+            _RATE_SMOOTHING * observed + (1 - _RATE_SMOOTHING) * source.new_jobs_per_hour
+        )
+
+    if source.scrape_interval_minutes:
+        return base, "fixed per-source interval"
+    if not settings.scheduler_adaptive:
+        return base, "default interval"
+    if first_run:
+        return base, "default interval until new-job rate is known"
+
+    floor = normalize_interval(settings.scheduler_min_interval_minutes)
+    rate = source.new_jobs_per_hour
+    if rate <= 0:
+        # Nothing new since the baseline: back off gradually rather than at once.
+        minutes = min(max((source.current_interval_minutes or base) * 2, floor), ceiling)
+        return minutes, "no new jobs observed yet"
+    target_minutes = settings.scheduler_target_new_jobs / rate * 60
+    minutes = round(min(max(target_minutes, floor), ceiling))
+    return minutes, f"{rate * 24:.1f} new jobs/day observed"
+
+
+def _jittered(interval: timedelta) -> timedelta:
+    ratio = min(max(settings.scheduler_jitter_ratio, 0.0), 1.0)
+    return interval * random.uniform(1 - ratio, 1 + ratio)
 
 
 class ScrapeScheduler:
     def __init__(self) -> None:
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
         self._task: asyncio.Task[None] | None = None
-        self._is_running_scrape = False
+        self._wakeup = asyncio.Event()
+        self._needs_reload = True
+        self._resync_at: datetime | None = None
+        self._heap: list[tuple[datetime, int]] = []
+        self._running: dict[int, asyncio.Task[None]] = {}
+        self._host_slots: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(max(1, settings.scraper_max_per_host))
+        )
 
     async def start(self) -> None:
         if self._task and not self._task.done():
             return
+        self._needs_reload = True
         self._task = asyncio.create_task(self._loop(), name="scrape-scheduler-loop")
-        logger.info("Scrape scheduler started")
+        logger.info("Scrape scheduler started (worker %s)", self.worker_id)
+
+    async def halt(self) -> None:
+        """Stop claiming sources and cancel in-flight scrapes, keeping their leases."""
+        if not self._task:
+            return
+        tasks = [self._task, *self._running.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     async def stop(self) -> None:
+        """Halt, then release this worker's leases."""
         if not self._task:
             return
-        self._task.cancel()
+        await self.halt()
         try:
-            await self._task
-        except asyncio.CancelledError:
-            pass
+            await self._release_leases()
+        except Exception:
+            logger.warning("Failed to release scheduler leases", exc_info=True)
         logger.info("Scrape scheduler stopped")
 
+    def wake(self) -> None:
+        """Reload source schedules from the database (call after they change)."""
+        self._needs_reload = True
+        self._wakeup.set()
+
+    def _free_slots(self) -> int:
+        return max(1, settings.scraper_max_concurrency) - len(self._running)
+
     async def _loop(self) -> None:
         while True:
             try:
-                await self._tick()
+                self._wakeup.clear()
+                now_utc = datetime.now(timezone.utc)
+                retry_after = 0.0
+                if self._free_slots() > 0 and self._heap and self._heap[0][0] <= now_utc:
+                    if not await self._claim_due():
+                        retry_after = _CLAIM_RETRY_SECONDS
+                    self._needs_reload = True
+                if self._needs_reload or self._resync_at is None or now_utc >= self._resync_at:
+                    self._needs_reload = False
+                    await self._reload()
+
+                now_utc = datetime.now(timezone.utc)
+                timeout = (self._resync_at - now_utc).total_seconds()
+                if self._heap and self._free_slots() > 0:
+                    until_due = (self._heap[0][0] - now_utc).total_seconds()
+                    timeout = min(timeout, max(until_due, retry_after))
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=max(0.0, timeout))
+                except TimeoutError:
+                    pass
             except asyncio.CancelledError:
                 raise
             except Exception:
                 logger.exception("Unexpected scheduler loop error")
-            await asyncio.sleep(_POLL_INTERVAL_SECONDS)
-
-    async def _tick(self) -> None:
-        if self._is_running_scrape:
-            return
+                self._needs_reload = True
+                await asyncio.sleep(_ERROR_RETRY_SECONDS)
 
+    async def _reload(self) -> None:
+        """Rebuild the heap from the active sources' persisted due times."""
         now_utc = datetime.now(timezone.utc)
-        async with AsyncSessionLocal() as db:
+        self._resync_at = now_utc + timedelta(seconds=settings.scheduler_resync_seconds)
+        async with ScrapeSessionLocal() as db:
             schedule = await ensure_schedule_row(db)
+            heap: list[tuple[datetime, int]] = []
+            if schedule.is_enabled:
+                result = await db.execute(select(Source).where(Source.is_active.is_(True)))
+                for source in result.scalars().all():
+                    if source.id in self._running:
+                        continue
+                    if source.next_scrape_at is None:
+                        # Spread new sources across their first interval.
+                        interval = source_interval(source, schedule)
+                        source.next_scrape_at = now_utc + interval * random.random()
+                        mark_changed(db, SOURCES_SCOPE)
+                    due_at = source.next_scrape_at
+                    # Leased elsewhere: claimable once the lease expires, unless
+                    # the holder reschedules it first (picked up on resync).
+                    if source.lease_expires_at is not None and source.lease_expires_at > due_at:
+                        due_at = source.lease_expires_at
+                    heap.append((due_at, source.id))
+            heapq.heapify(heap)
+            self._heap = heap
+            next_run_at = heap[0][0] if heap else None
+            if schedule.next_run_at != next_run_at:
+                schedule.next_run_at = next_run_at
+            # Most wakes change nothing; only write when something did.
+            if db.new or db.dirty:
+                await commit_and_publish(db)
 
+    async def _claim_due(self) -> int:
+        """Lease up to the free slot count of due sources and start scraping them."""
+        lease = timedelta(seconds=settings.scheduler_lease_seconds)
+        async with ScrapeSessionLocal() as db:
+            schedule = await ensure_schedule_row(db)
             if not schedule.is_enabled:
                 await db.commit()
-                return
-
-            if schedule.next_run_at is None:
-                schedule.next_run_at = calculate_next_run(
-                    now_utc=now_utc,
-                    interval_minutes=schedule.interval_minutes,
+                return 0
+            due = (
+                select(Source.id)
+                .where(
+                    Source.is_active.is_(True),
+                    Source.next_scrape_at <= func.now(),
+                    or_(Source.lease_expires_at.is_(None), Source.lease_expires_at < func.now()),
                 )
-                await db.commit()
-                return
+                .order_by(Source.next_scrape_at)
+                .limit(self._free_slots())
+                .with_for_update(skip_locked=True)
+            )
+            result = await db.execute(
+                update(Source)
+                .where(Source.id.in_(due.scalar_subquery()))
+                .values(lease_owner=self.worker_id, lease_expires_at=func.now() + lease)
+                .returning(Source.id, Source.base_url, Source.last_scraped_at)
+                .execution_options(synchronize_session=False)
+            )
+            claimed = result.tuples().all()
+            await db.commit()
 
-            if schedule.next_run_at > now_utc:
-                await db.commit()
-                return
+        for source_id, base_url, last_scraped_at in claimed:
+            self._running[source_id] = asyncio.create_task(
+                self._run(source_id, base_url, last_scraped_at),
+                name=f"scheduled-scrape-{source_id}",
+            )
+        return len(claimed)
 
-            self._is_running_scrape = True
+    async def _run(
+        self, source_id: int, base_url: str, last_scraped_at: datetime | None
+    ) -> None:
+        renewal = asyncio.create_task(self._renew_lease(source_id))
+        try:
+            jobs_new, failed = await self._scrape(source_id, base_url)
             try:
-                logger.info("Scheduled scrape started")
-                result = await run_all_sources(db)
-                schedule.last_run_at = datetime.now(timezone.utc)
-                schedule.next_run_at = calculate_next_run(
-                    now_utc=schedule.last_run_at,
-                    interval_minutes=schedule.interval_minutes,
-                )
-                await db.commit()
-                logger.info(
-                    "Scheduled scrape finished: sources=%s found=%s new=%s errors=%s",
-                    result.sources_processed,
-                    result.jobs_found,
-                    result.jobs_new,
-                    len(result.errors),
-                )
-                for err in result.errors:
-                    logger.error("Scheduled scrape error: %s", err)
+                await self._reschedule(source_id, jobs_new, failed, last_scraped_at)
+            except Exception:
+                logger.exception("Failed to reschedule source %s", source_id)
+        finally:
+            renewal.cancel()
+            self._running.pop(source_id, None)
+            self.wake()
+
+    async def _scrape(self, source_id: int, base_url: str) -> tuple[int, bool]:
+        """Scrape a claimed source; returns (jobs_new, failed)."""
+        try:
+            async with self._host_slots[source_host(base_url)]:
+                found, new, errors = await dispatch_source(source_id, base_url)
+        except Exception:
+            logger.exception("Scheduled scrape of source %s failed", source_id)
+            return 0, True
+        logger.info(
+            "Scheduled scrape of source %s finished: found=%s new=%s errors=%s",
+            source_id,
+            found,
+            new,
+            len(errors),
+        )
+        for err in errors:
+            logger.error("Scheduled scrape error: %s", err)
+        return new, bool(errors)
+
+    async def _renew_lease(self, source_id: int) -> None:
+        """Extend this worker's lease on a source while its scrape runs."""
+        lease = timedelta(seconds=settings.scheduler_lease_seconds)
+        while True:
+            await asyncio.sleep(lease.total_seconds() / 3)
+            try:
+                async with ScrapeSessionLocal() as db:
+                    await db.execute(
+                        update(Source)
+                        .where(Source.id == source_id, Source.lease_owner == self.worker_id)
+                        .values(lease_expires_at=func.now() + lease)
+                    )
+                    await db.commit()
             except Exception:
-                await db.rollback()
-                logger.exception("Scheduled scrape failed")
-            finally:
-                self._is_running_scrape = False
+                logger.warning("Failed to renew lease on source %s", source_id, exc_info=True)
+
+    async def _reschedule(
+        self,
+        source_id: int,
+        jobs_new: int,
+        failed: bool,
+        last_scraped_at: datetime | None,
+    ) -> None:
+        """Persist the source's next due time and release this worker's lease.
+
+        `last_scraped_at` is the source's previous scrape time, read when it
+        was claimed: `jobs_new` accumulated since then, whatever the interval,
+        jitter, downtime or manual runs in between.
+        """
+        now_utc = datetime.now(timezone.utc)
+        elapsed = now_utc - last_scraped_at if last_scraped_at is not None else None
+        async with ScrapeSessionLocal() as db:
+            schedule = await ensure_schedule_row(db)
+            schedule.last_run_at = now_utc
+            source = await db.get(Source, source_id)
+            if source is not None and source.lease_owner == self.worker_id:
+                minutes, reason = adapt_interval(source, schedule, jobs_new, failed, elapsed)
+                source.current_interval_minutes = minutes
+                source.interval_reason = reason
+                if source.is_active and schedule.is_enabled:
+                    interval = _jittered(timedelta(minutes=minutes))
+                    source.next_scrape_at = now_utc + interval
+                source.lease_owner = None
+                source.lease_expires_at = None
+                mark_changed(db, SOURCES_SCOPE)
+            await db.flush()
+            schedule.next_run_at = await db.scalar(
+                select(func.min(Source.next_scrape_at)).where(Source.is_active.is_(True))
+            )
+            await commit_and_publish(db)
+
+    async def _release_leases(self) -> None:
+        async with ScrapeSessionLocal() as db:
+            await db.execute(
+                update(Source)
+                .where(Source.lease_owner == self.worker_id)
+                .values(lease_owner=None, lease_expires_at=None)
+            )
+            await db.commit()
 
 
 scrape_scheduler = ScrapeScheduler()
@@ -1,20 +1,26 @@
 """Pydantic schemas for request validation and response serialization."""
 
-from datetime import datetime
+from datetime import date, datetime
+from typing import Literal
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, model_validator
 
-from app.models import JobStatus
+from app.models import JobStatus, ScrapeRunStatus
 
 
 # ── Source schemas ─────────────────────────────────────────────────────────────
 
+ResourceProfile = Literal["minimal", "css", "full"]
+
+
 class SourceBase(BaseModel):
     name: str
     base_url: str
     keyword: str
     query_param: str = "q"
     url_path_filter: str | None = None
+    resource_profile: ResourceProfile | None = None
+    scrape_interval_minutes: int | None = Field(None, ge=5)
 
 
 class SourceCreate(SourceBase):
@@ -29,6 +35,8 @@ class SourceUpdate(BaseModel):
     keyword: str | None = None
     query_param: str | None = None
     url_path_filter: str | None = None
+    resource_profile: ResourceProfile | None = None
+    scrape_interval_minutes: int | None = Field(None, ge=5)
     is_active: bool | None = None
     clear_blocked: bool | None = None
 
@@ -43,6 +51,12 @@ class SourceRead(SourceBase):
     blocked_at: datetime | None
     last_error: str | None
     last_scraped_at: datetime | None
+    last_full_scrape_at: datetime | None
+    next_scrape_at: datetime | None
+    current_interval_minutes: int | None
+    interval_reason: str | None
+    new_jobs_per_hour: float | None
+    consecutive_failures: int
     created_at: datetime
 
     model_config = {"from_attributes": True}
@@ -71,11 +85,46 @@ class ScheduleUpdate(BaseModel):
 
 # ── Scrape result schema ───────────────────────────────────────────────────────
 
-class ScrapeResult(BaseModel):
+class ScrapeRunSourceRead(BaseModel):
+    source_id: int | None
+    source_name: str
+    status: ScrapeRunStatus
+    jobs_found: int
+    jobs_new: int
+    blocked_requests: int
+    error: str | None
+    started_at: datetime | None
+    finished_at: datetime | None
+
+    model_config = {"from_attributes": True}
+
+
+class ScrapeRunRead(BaseModel):
+    """A background scrape run and the progress of each of its sources."""
+
+    id: int
+    status: ScrapeRunStatus
     sources_processed: int
     jobs_found: int
     jobs_new: int
-    errors: list[str] = []
+    errors: list[str]
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
+    sources: list[ScrapeRunSourceRead]
+
+    model_config = {"from_attributes": True}
+
+
+class ScrapeRunListResponse(BaseModel):
+    total: int
+    items: list[ScrapeRunRead]
+
+
+class HttpPoolStats(BaseModel):
+    requests_sent: int
+    connections_opened: int
+    connections_reused: int
 
 
 class JobBase(BaseModel):
@@ -97,10 +146,43 @@ class JobUpdate(BaseModel):
     status: JobStatus
 
 
+class JobFilter(BaseModel):
+    """Job filters shared by the listing and bulk update endpoints."""
+
+    status: JobStatus | None = None
+    source_id: int | None = None
+    company: str | None = None
+    location: str | None = None
+    scraped_after: datetime | None = None
+    scraped_before: datetime | None = None
+
+
+class JobBulkUpdate(BaseModel):
+    """Set the status of many jobs, selected by ID or by filter."""
+
+    status: JobStatus
+    ids: list[int] | None = Field(None, max_length=10_000)
+    filter: JobFilter | None = None
+
+    @model_validator(mode="after")
+    def _check_selection(self) -> "JobBulkUpdate":
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of 'ids' or 'filter'")
+        if self.filter is not None and not self.filter.model_dump(exclude_none=True):
+            raise ValueError("'filter' must set at least one field")
+        return self
+
+
+class JobBulkUpdateResult(BaseModel):
+    updated: int
+    ids: list[int]
+
+
 class JobRead(JobBase):
     """Schema returned by API endpoints."""
 
     id: int
+    source_id: int | None
     status: JobStatus
     scraped_at: datetime
     updated_at: datetime
@@ -109,7 +191,39 @@ class JobRead(JobBase):
 
 
 class JobListResponse(BaseModel):
-    """Paginated list of jobs."""
+    """Paginated list of jobs.
 
-    total: int
+    `total` is None when the caller asked to skip counting, and a planner
+    estimate when `count=estimated`.
+    """
+
+    total: int | None
     items: list[JobRead]
+    next_cursor: str | None = None
+
+
+# ── Stats schemas ──────────────────────────────────────────────────────────────
+
+class SourceStats(BaseModel):
+    """Job counts for one source; `source_id` is None for jobs without a source."""
+
+    source_id: int | None
+    source_name: str | None
+    total: int
+    by_status: dict[JobStatus, int]
+
+
+class StatsSummary(BaseModel):
+    total: int
+    by_status: dict[JobStatus, int]
+    sources: list[SourceStats]
+
+
+class DailyStats(BaseModel):
+    day: date
+    total: int
+    by_status: dict[JobStatus, int]
+
+
+class DailyStatsResponse(BaseModel):
+    items: list[DailyStats]
@@ -1,12 +1,58 @@
 """Abstract base class for all Playwright-based scrapers."""
 
-import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack
+import logging
+from urllib.parse import urlparse
 
-from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+from playwright.async_api import BrowserContext, Locator, Page, Route
 
 from app.config import settings
 from app.schemas import JobCreate
+from app.scraper.browser_pool import browser_pool
+from app.scraper.rate_limit import rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# Resource types aborted by each request-interception profile. "full" (the
+# default) loads everything; scrapers only need the DOM, so "minimal" drops
+# everything presentational and "css" keeps styling for boards whose layout
+# (and so their links) break without it.
+RESOURCE_PROFILES: dict[str, frozenset[str]] = {
+    "minimal": frozenset({"image", "media", "font", "stylesheet"}),
+    "css": frozenset({"image", "media"}),
+    "full": frozenset(),
+}
+
+# Analytics / ad hosts aborted under every profile except "full".
+_TRACKER_DOMAINS = frozenset(
+    {
+        "google-analytics.com",
+        "googletagmanager.com",
+        "doubleclick.net",
+        "googlesyndication.com",
+        "facebook.net",
+        "hotjar.com",
+        "segment.io",
+        "segment.com",
+        "mixpanel.com",
+        "nr-data.net",
+        "newrelic.com",
+        "fullstory.com",
+        "clarity.ms",
+        "ads.linkedin.com",
+        "snap.licdn.com",
+        "bat.bing.com",
+        "optimizely.com",
+        "quantserve.com",
+        "scorecardresearch.com",
+    }
+)
+
+
+def _is_tracker_host(host: str) -> bool:
+    return any(host == domain or host.endswith("." + domain) for domain in _TRACKER_DOMAINS)
 
 
 class BaseScraper(ABC):
@@ -14,7 +60,8 @@ class BaseScraper(ABC):
     Base class for all job scrapers.
 
     Subclass this and implement `scrape()` to build a new scraper.
-    Each scraper gets its own Playwright browser context (isolated cookies/state).
+    Each scraper gets its own Playwright browser context (isolated cookies/state)
+    from the shared browser pool, so only context creation is paid per source.
 
     Example:
         class LinkedInScraper(BaseScraper):
@@ -28,9 +75,14 @@ class BaseScraper(ABC):
 
     source: str  # Must be set on subclasses
 
-    def __init__(self) -> None:
-        self._playwright = None
-        self._browser: Browser | None = None
+    def __init__(self, resource_profile: str | None = None) -> None:
+        profile = resource_profile or settings.scraper_resource_profile
+        if profile not in RESOURCE_PROFILES:
+            logger.warning("Unknown resource profile %r; using 'full'", profile)
+            profile = "full"
+        self.resource_profile = profile
+        self.blocked_requests = 0
+        self._exit_stack: AsyncExitStack | None = None
         self._context: BrowserContext | None = None
         self._page: Page | None = None
 
@@ -43,34 +95,54 @@ class BaseScraper(ABC):
         return self._page
 
     async def __aenter__(self) -> "BaseScraper":
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(
-            headless=settings.playwright_headless,
-        )
-        self._context = await self._browser.new_context(
-            user_agent=(
-                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            ),
-            viewport={"width": 1280, "height": 900},
-        )
-        self._page = await self._context.new_page()
+        self._exit_stack = AsyncExitStack()
+        try:
+            self._context = await self._exit_stack.enter_async_context(
+                browser_pool.context(
+                    user_agent=(
+                        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+                        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+                    ),
+                    viewport={"width": 1280, "height": 900},
+                )
+            )
+            if self.resource_profile != "full":
+                await self._context.route("**/*", self._route_request)
+            self._page = await self._context.new_page()
+        except BaseException:
+            await self._exit_stack.aclose()
+            self._exit_stack = None
+            raise
         self._page.set_default_timeout(settings.scraper_timeout_seconds * 1000)
         return self
 
     async def __aexit__(self, *args: object) -> None:
-        if self._context:
-            await self._context.close()
-        if self._browser:
-            await self._browser.close()
-        if self._playwright:
-            await self._playwright.stop()
+        if self._exit_stack:
+            await self._exit_stack.aclose()
+        self._exit_stack = None
+        self._context = None
+        self._page = None
+
+    async def _route_request(self, route: Route) -> None:
+        request = route.request
+        host = (urlparse(request.url).hostname or "").lower()
+        blocked_types = RESOURCE_PROFILES[self.resource_profile]
+        if request.resource_type in blocked_types or _is_tracker_host(host):
+            self.blocked_requests += 1
+            await route.abort()
+            return
+        await route.continue_()
 
     async def polite_goto(self, url: str) -> None:
-        """Navigate to a URL with a configurable delay to respect rate limits."""
-        await asyncio.sleep(settings.scraper_delay_seconds)
+        """Navigate to a URL once the host's rate limit allows it."""
+        await rate_limiter.acquire(urlparse(url).hostname or "")
         await self.page.goto(url, wait_until="domcontentloaded")
 
+    async def polite_click(self, locator: Locator) -> None:
+        """Click a navigating element (e.g. a "Next" link) once the host allows it."""
+        await rate_limiter.acquire(urlparse(self.page.url).hostname or "")
+        await locator.click()
+
     @abstractmethod
     async def scrape(self) -> list[JobCreate]:
         """
@@ -79,3 +151,12 @@ class BaseScraper(ABC):
         Returns a list of JobCreate schemas ready to be inserted into the DB.
         """
         ...
+
+    async def scrape_batches(self) -> AsyncIterator[list[JobCreate]]:
+        """
+        Yield jobs in batches so the runner can persist them as they arrive.
+
+        The default adapts `scrape()` into a single batch; override it to stream
+        page by page (and implement `scrape()` by collecting the batches).
+        """
+        yield await self.scrape()
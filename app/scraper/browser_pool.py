@@ -0,0 +1,173 @@
+"""Process-wide Chromium pool shared by all Playwright-based scrapers.
+
+Launching Chromium costs seconds and ~150 MB per scraper, so instead a single
+long-lived browser hands out fresh, isolated `BrowserContext`s (separate
+cookies/storage). The browser is retired and replaced after it has opened a
+configured number of pages, or when the browser process tree grows past an
+RSS threshold; a retired browser is closed once its last context finishes.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _process_tree_rss_bytes() -> int | None:
+    """Return the summed RSS of this process's descendants, or None if unsupported.
+
+    Chromium runs as child processes of the Playwright driver, so this is a
+    proxy for browser memory. Only Linux (/proc) is supported.
+    """
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return None
+
+    children: dict[int, list[int]] = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # The comm field may contain spaces; fields after the closing paren are fixed.
+        fields = stat.rsplit(")", 1)[-1].split()
+        children.setdefault(int(fields[1]), []).append(int(entry.name))
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    stack = list(children.get(os.getpid(), []))
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(pid, []))
+        try:
+            rss_pages = int((proc / str(pid) / "statm").read_text().split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        total += rss_pages * page_size
+    return total
+
+
+class _PooledBrowser:
+    def __init__(self, browser: Browser) -> None:
+        self.browser = browser
+        self.active_contexts = 0
+        self.pages_opened = 0
+        self.retired = False
+
+
+class BrowserPool:
+    """Hands out isolated browser contexts from a shared, recycled Chromium."""
+
+    def __init__(self) -> None:
+        self._playwright: Playwright | None = None
+        self._current: _PooledBrowser | None = None
+        self._lock = asyncio.Lock()
+        self._slots: asyncio.Semaphore | None = None
+        self.browsers_launched = 0
+        self.contexts_served = 0
+
+    def _context_slots(self) -> asyncio.Semaphore:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(max(1, settings.browser_pool_max_contexts))
+        return self._slots
+
+    def _recycle_reason(self, pooled: _PooledBrowser, rss: int | None) -> str | None:
+        """Return why `pooled` should be retired, or None to keep using it."""
+        if not pooled.browser.is_connected():
+            return "browser disconnected"
+        max_pages = settings.browser_pool_recycle_after_pages
+        if max_pages > 0 and pooled.pages_opened >= max_pages:
+            return f"{pooled.pages_opened} pages opened"
+        max_rss_mb = settings.browser_pool_max_rss_mb
+        if max_rss_mb > 0 and rss is not None and rss >= max_rss_mb * 1024 * 1024:
+            return f"process tree RSS {rss // (1024 * 1024)} MB over {max_rss_mb} MB"
+        return None
+
+    async def _retire(self, pooled: _PooledBrowser) -> None:
+        pooled.retired = True
+        if pooled.active_contexts == 0:
+            await self._close_browser(pooled)
+
+    async def _close_browser(self, pooled: _PooledBrowser) -> None:
+        try:
+            await pooled.browser.close()
+        except Exception:
+            logger.warning("Failed to close pooled browser", exc_info=True)
+
+    async def _acquire_browser(self) -> _PooledBrowser:
+        rss = None
+        if settings.browser_pool_max_rss_mb > 0:
+            # Walking /proc is blocking file I/O, so it runs in a thread and
+            # before taking the lock that every context acquire waits on.
+            rss = await asyncio.to_thread(_process_tree_rss_bytes)
+        async with self._lock:
+            current = self._current
+            reason = self._recycle_reason(current, rss) if current is not None else None
+            if current is not None and reason is not None:
+                logger.info("Recycling pooled browser: %s", reason)
+                self._current = None
+                await self._retire(current)
+
+            if self._current is None:
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                browser = await self._playwright.chromium.launch(
+                    headless=settings.playwright_headless,
+                )
+                self._current = _PooledBrowser(browser)
+                self.browsers_launched += 1
+
+            self._current.active_contexts += 1
+            return self._current
+
+    async def _release_browser(self, pooled: _PooledBrowser) -> None:
+        async with self._lock:
+            pooled.active_contexts -= 1
+            if pooled.retired and pooled.active_contexts == 0:
+                await self._close_browser(pooled)
+
+    @asynccontextmanager
+    async def context(self, **kwargs: Any) -> AsyncIterator[BrowserContext]:
+        """Yield a fresh browser context; at most `BROWSER_POOL_MAX_CONTEXTS` at once."""
+        async with self._context_slots():
+            pooled = await self._acquire_browser()
+            try:
+                browser_context = await pooled.browser.new_context(**kwargs)
+                browser_context.on(
+                    "page",
+                    lambda _page: setattr(pooled, "pages_opened", pooled.pages_opened + 1),
+                )
+                self.contexts_served += 1
+                try:
+                    yield browser_context
+                finally:
+                    try:
+                        await browser_context.close()
+                    except Exception:
+                        logger.warning("Failed to close browser context", exc_info=True)
+            finally:
+                await self._release_browser(pooled)
+
+    async def close(self) -> None:
+        """Close the shared browser and Playwright driver (called on app shutdown)."""
+        async with self._lock:
+            if self._current is not None:
+                await self._close_browser(self._current)
+                self._current = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+
+browser_pool = BrowserPool()
@@ -0,0 +1,110 @@
+"""URL canonicalization and content fingerprints for deduplicating postings.
+
+The same posting is often reachable under several URLs (tracking parameters,
+locale path segments, mixed-case hosts) and is sometimes mirrored on other
+boards. `canonicalize_url` maps URL variants to one form and `job_fingerprint`
+hashes the normalized title, company and location; both are stored on `jobs`
+and indexed so ingestion can skip near-duplicates with one lookup.
+
+A fingerprint alone doesn't identify a posting: one board can list several
+openings with the same title, and a role can be reposted. Ingestion therefore
+only uses it to recognise the same role mirrored by a different source, and
+only when the posting has a location.
+"""
+
+import hashlib
+import re
+import unicodedata
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Locale path segments such as "en-US" or "de_de" (cf. workday._LOCALE_RE).
+_LOCALE_SEGMENT_RE = re.compile(r"^[a-z]{2}[-_][a-z]{2}$", re.IGNORECASE)
+
+# Query parameters that only attribute the click, never identify the posting.
+_TRACKING_PARAMS = frozenset(
+    {
+        "_hsenc",
+        "_hsmi",
+        "fbclid",
+        "gclid",
+        "gh_src",
+        "iis",
+        "iisn",
+        "lever-origin",
+        "lever-source",
+        "mc_cid",
+        "mc_eid",
+        "msclkid",
+        "ref",
+        "referrer",
+        "refid",
+        "source",
+        "src",
+        "trackingid",
+        "trk",
+    }
+)
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in _TRACKING_PARAMS or name.startswith("utm_")
+
+
+def canonicalize_url(url: str) -> str:
+    """Return the canonical form of a posting URL, used as a dedupe key.
+
+    Forces https, lowercases the host and drops `www.`, default ports, locale
+    path segments, trailing slashes, tracking parameters and plain fragments
+    (hash routes like `#/job/123` are kept). Remaining parameters are sorted.
+    """
+    parts = urlsplit(url.strip())
+    original_scheme = parts.scheme.lower()
+    scheme = "https" if original_scheme == "http" else original_scheme
+
+    host = (parts.hostname or "").lower().removeprefix("www.")
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    # Compare against the default of the scheme the URL was given with, so
+    # http://host:80 and https://host:443 both lose their port.
+    if port is not None and port != _DEFAULT_PORTS.get(original_scheme):
+        host = f"{host}:{port}"
+
+    segments = [
+        segment
+        for segment in parts.path.split("/")
+        if segment and not _LOCALE_SEGMENT_RE.match(segment)
+    ]
+    path = "/" + "/".join(segments)
+
+    params = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(name)
+    ]
+    query = urlencode(sorted(params))
+
+    fragment = parts.fragment if parts.fragment.startswith(("/", "!")) else ""
+    return urlunsplit((scheme, host, path, query, fragment))
+
+
+def _normalize_text(value: str | None) -> str:
+    text = unicodedata.normalize("NFKC", value or "").casefold()
+    return " ".join(_NON_WORD_RE.sub(" ", text).split())
+
+
+def job_fingerprint(title: str, company: str, location: str | None) -> str | None:
+    """Return a hex SHA-256 of the normalized title, company and location.
+
+    Returns None without a location: title and company alone are too weak to
+    match postings on.
+    """
+    parts = [_normalize_text(value) for value in (title, company, location)]
+    if not parts[2]:
+        return None
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
@@ -7,6 +7,7 @@ This works well for simple job boards (custom career pages, Lever, Greenhouse,
 etc.). For Workday ATS sites use WorkdayScraper instead.
 """
 
+from collections.abc import AsyncIterator
 import logging
 from urllib.parse import quote_plus, urljoin
 
@@ -41,6 +42,25 @@ _MAX_TITLE_LEN = 150
 _MAX_PAGES = 30
 _MAX_STALE_PAGES = 2
 
+# Collects [href, innerText] for every link matching the job URL rules in a
+# single evaluate() call. Args: [fragments, urlPathFilter | null].
+_EXTRACT_LINKS_JS = """
+([fragments, pathFilter]) => {
+  const out = [];
+  for (const a of document.querySelectorAll("a[href]")) {
+    const href = a.getAttribute("href") || "";
+    const lower = href.toLowerCase();
+    const matches = pathFilter
+      ? lower.includes(pathFilter)
+      : fragments.some((frag) => lower.includes(frag));
+    if (matches) {
+      out.push([href, a.innerText || ""]);
+    }
+  }
+  return out;
+}
+"""
+
 
 class GenericScraper(BaseScraper):
     """Heuristic scraper that extracts job links from an arbitrary job board page."""
@@ -52,8 +72,9 @@ class GenericScraper(BaseScraper):
         keyword: str,
         query_param: str = "q",
         url_path_filter: str | None = None,
+        resource_profile: str | None = None,
     ) -> None:
-        super().__init__()
+        super().__init__(resource_profile=resource_profile)
         self.source = source_name
         self._source_name = source_name
         self._base_url = base_url
@@ -101,21 +122,45 @@ class GenericScraper(BaseScraper):
         text = (await active.inner_text()).strip()
         return text or None
 
+    async def _extract_links(self) -> list[tuple[str, str]]:
+        """Return (href, text) for candidate job links in one in-page pass.
+
+        Links are pre-filtered in the browser with the same rules as
+        `_looks_like_job_url`, so only candidates cross the CDP boundary.
+        """
+        pairs = await self.page.evaluate(
+            _EXTRACT_LINKS_JS,
+            [sorted(_JOB_URL_FRAGMENTS), self._url_path_filter],
+        )
+        return [(href, text) for href, text in pairs]
+
+    async def _extract_links_per_locator(self) -> list[tuple[str, str]]:
+        """Slow fallback: two round-trips per link."""
+        pairs: list[tuple[str, str]] = []
+        for link in await self.page.locator("a[href]").all():
+            try:
+                href = await link.get_attribute("href") or ""
+                text = await link.inner_text()
+            except Exception:
+                continue
+            pairs.append((href, text))
+        return pairs
+
     async def _collect_jobs_from_current_page(
         self,
         seen_urls: set[str],
         jobs: list[JobCreate],
     ) -> int:
         page_url = self.page.url
-        links = await self.page.locator("a[href]").all()
+        try:
+            links = await self._extract_links()
+        except Exception:
+            logger.debug("In-page link extraction failed; using locators", exc_info=True)
+            links = await self._extract_links_per_locator()
         added = 0
 
-        for link in links:
-            try:
-                href = await link.get_attribute("href") or ""
-                text = (await link.inner_text()).strip()
-            except Exception:
-                continue
+        for href, raw_text in links:
+            text = raw_text.strip()
 
             if not self._looks_like_job_url(href):
                 continue
@@ -140,22 +185,23 @@ class GenericScraper(BaseScraper):
 
         return added
 
-    async def scrape(self) -> list[JobCreate]:
+    async def scrape_batches(self) -> AsyncIterator[list[JobCreate]]:
         await self.polite_goto(self._build_url())
 
         seen_urls: set[str] = set()
-        jobs: list[JobCreate] = []
         stale_pages = 0
 
         for _ in range(_MAX_PAGES):
             await self._wait_for_page_settle()
             await self._detect_antibot_block()
-            added = await self._collect_jobs_from_current_page(seen_urls, jobs)
+            page_jobs: list[JobCreate] = []
+            added = await self._collect_jobs_from_current_page(seen_urls, page_jobs)
 
             if added == 0:
                 stale_pages += 1
             else:
                 stale_pages = 0
+                yield page_jobs
 
             next_item = self.page.locator(
                 "ul.pagination li.page-item", has_text="Next"
@@ -172,7 +218,7 @@ class GenericScraper(BaseScraper):
                 break
 
             active_before = await self._active_page_token()
-            await next_link.click()
+            await self.polite_click(next_link)
             await self._wait_for_page_settle()
             active_after = await self._active_page_token()
 
@@ -182,4 +228,5 @@ class GenericScraper(BaseScraper):
             if stale_pages >= _MAX_STALE_PAGES:
                 break
 
-        return jobs
+    async def scrape(self) -> list[JobCreate]:
+        return [job async for batch in self.scrape_batches() for job in batch]
@@ -0,0 +1,104 @@
+"""Application-scoped pooled HTTP client shared by API-based scrapers.
+
+Many Workday sources live on the same `wdN.myworkdayjobs.com` cluster, so a
+single long-lived `httpx.AsyncClient` keeps TLS sessions and keep-alive
+connections warm across scrapers and runs. Requests are additionally capped
+per hostname, and connection setup is traced so reuse can be reported.
+"""
+
+import asyncio
+from collections import defaultdict
+import logging
+from typing import Any
+
+import httpx
+
+from app.config import settings
+from app.scraper.rate_limit import rate_limiter
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+}
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class HttpClientPool:
+    """Lazily created shared `httpx.AsyncClient` with per-host request limits."""
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        self._host_limits: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(max(1, settings.http_pool_max_per_host))
+        )
+        self.requests_sent = 0
+        self.connections_opened = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            http2 = settings.http_pool_http2
+            if http2 and not _http2_available():
+                logger.warning("HTTP_POOL_HTTP2 is set but 'h2' is not installed; using HTTP/1.1")
+                http2 = False
+            self._client = httpx.AsyncClient(
+                headers=_DEFAULT_HEADERS,
+                timeout=settings.scraper_timeout_seconds,
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=settings.http_pool_max_connections,
+                    max_keepalive_connections=settings.http_pool_max_keepalive,
+                    keepalive_expiry=settings.http_pool_keepalive_expiry_seconds,
+                ),
+            )
+        return self._client
+
+    async def _trace(self, event_name: str, info: dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self.connections_opened += 1
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the shared client, rate limited and bounded per hostname."""
+        client = self._get_client()
+        host = httpx.URL(url).host
+        # Wait for a token before taking a connection slot, so requests queued
+        # behind the rate limit don't hold slots idle.
+        await rate_limiter.acquire(host)
+        async with self._host_limits[host]:
+            self.requests_sent += 1
+            return await client.request(
+                method,
+                url,
+                extensions={"trace": self._trace},
+                **kwargs,
+            )
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    def stats(self) -> dict[str, int]:
+        reused = max(0, self.requests_sent - self.connections_opened)
+        return {
+            "requests_sent": self.requests_sent,
+            "connections_opened": self.connections_opened,
+            "connections_reused": reused,
+        }
+
+    async def close(self) -> None:
+        """Close the shared client (called on app shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+http_pool = HttpClientPool()
@@ -0,0 +1,125 @@
+"""Optional process pool for browser-based (generic) scrapes.
+
+Playwright scrapes are CPU and memory heavy; running them in child processes
+keeps them off the worker's event loop and lets them use several cores. Each
+child owns its own event loop, Chromium pool, HTTP client and database pools
+for its lifetime and scrapes one source at a time through
+`run_source_isolated`, so results are committed by the child exactly as they
+would be in-process. Only `app.worker` starts the pool; when it is not
+running, `dispatch_source` scrapes in the calling process.
+"""
+
+import asyncio
+import atexit
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import logging
+import multiprocessing
+
+from app.database import engine, scrape_engine
+from app.logging_utils import configure_logging
+from app.scraper.browser_pool import browser_pool
+from app.scraper.http_pool import http_pool
+
+logger = logging.getLogger(__name__)
+
+# The child's event loop, reused by every scrape it runs so pooled connections
+# and the browser stay bound to one loop.
+_process_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _init_process() -> None:
+    global _process_loop
+    configure_logging()
+    _process_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_process_loop)
+    atexit.register(_close_process)
+
+
+async def _close_resources() -> None:
+    await browser_pool.close()
+    await http_pool.close()
+    await scrape_engine.dispose()
+    await engine.dispose()
+
+
+def _close_process() -> None:
+    if _process_loop is None:
+        return
+    _process_loop.run_until_complete(_close_resources())
+    _process_loop.close()
+
+
+def _scrape_in_process(source_id: int, run_id: int | None) -> tuple[int, int, list[str]]:
+    # Imported here because the runner imports this module.
+    from app.scraper.runner import run_source_isolated
+
+    assert _process_loop is not None
+    return _process_loop.run_until_complete(run_source_isolated(source_id, run_id))
+
+
+class ScrapeProcessPool:
+    """Runs sources in a pool of child processes once started."""
+
+    def __init__(self) -> None:
+        self._executor: ProcessPoolExecutor | None = None
+        self._processes = 0
+
+    @property
+    def running(self) -> bool:
+        return self._executor is not None
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # Spawned rather than forked: children must not inherit the parent's
+        # event loop, database connections or browser.
+        return ProcessPoolExecutor(
+            max_workers=self._processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_process,
+        )
+
+    def start(self, processes: int) -> None:
+        if self._executor is not None or processes < 1:
+            return
+        self._processes = processes
+        self._executor = self._new_executor()
+        logger.info("Scrape process pool started with %s processes", processes)
+        if processes > 1:
+            logger.warning(
+                "Per-host rate limits are enforced per process; with %s scrape "
+                "processes a shared host can receive up to %s times its configured rate",
+                processes,
+                processes,
+            )
+
+    async def run(self, source_id: int, run_id: int | None = None) -> tuple[int, int, list[str]]:
+        """Scrape one source in a child process; same result as `run_source_isolated`.
+
+        A child that dies (killed for memory, crashed) breaks the whole
+        executor, failing every scrape it was running. The executor is then
+        replaced so later scrapes still run, and each lost scrape is reported
+        as a failed source.
+        """
+        executor = self._executor
+        if executor is None:
+            raise RuntimeError("Scrape process pool is not running")
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, _scrape_in_process, source_id, run_id)
+        except BrokenProcessPool as exc:
+            if self._executor is executor:
+                logger.error("Scrape process pool broke (%s); starting a new one", exc)
+                self._executor = self._new_executor()
+                executor.shutdown(wait=False, cancel_futures=True)
+            return 0, 0, [f"[source {source_id}] Scrape process died: {exc}"]
+
+    async def close(self) -> None:
+        """Drop queued scrapes and wait for the ones in progress to finish."""
+        if self._executor is None:
+            return
+        executor, self._executor = self._executor, None
+        await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+        logger.info("Scrape process pool stopped")
+
+
+scrape_process_pool = ScrapeProcessPool()
@@ -0,0 +1,90 @@
+"""Per-host token-bucket rate limiting shared by every scraper in the process.
+
+Each hostname gets its own bucket, so sources on different hosts never slow
+each other down while sources sharing a host share its budget. A bucket
+holds up to `SCRAPER_HOST_BURST` tokens and refills one token every
+`SCRAPER_DELAY_SECONDS`; every page navigation and HTTP request to the host
+takes a token first. `SCRAPER_HOST_RATE_OVERRIDES` sets a different
+`[delay_seconds, burst]` for a host and its subdomains, e.g.
+`{"myworkdayjobs.com": [0.5, 4]}`. A delay of `0` disables limiting.
+Workday hosts without an override default to `WORKDAY_PAGE_CONCURRENCY`
+requests per `SCRAPER_DELAY_SECONDS` with a matching burst, the pacing their
+parallel pagination was designed for.
+
+Buckets live in memory, so each process (every API or worker process and each
+of the worker's child processes) limits its own requests: a host scraped from
+N processes at once can see up to N times the configured rate.
+"""
+
+import asyncio
+import logging
+import time
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_WORKDAY_DOMAIN = "myworkdayjobs.com"
+
+
+class TokenBucket:
+    """Async token bucket; waiters are served in arrival order."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate  # tokens per second; 0 = unlimited
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Take one token, waiting for it if needed. Returns the seconds waited."""
+        if self.rate <= 0:
+            return 0.0
+        async with self._lock:
+            self._refill()
+            waited = 0.0
+            if self._tokens < 1:
+                waited = (1 - self._tokens) / self.rate
+                await asyncio.sleep(waited)
+                self._refill()
+            self._tokens -= 1
+            return waited
+
+
+class HostRateLimiter:
+    """Lazily created token buckets keyed by hostname."""
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def _limits(self, host: str) -> tuple[float, int]:
+        delay, burst = settings.scraper_delay_seconds, settings.scraper_host_burst
+        # The most specific matching override wins.
+        for domain in sorted(settings.scraper_host_rate_overrides, key=len, reverse=True):
+            if host == domain or host.endswith("." + domain):
+                delay, burst = settings.scraper_host_rate_overrides[domain]
+                break
+        else:
+            if host.endswith("." + _WORKDAY_DOMAIN):
+                pages = max(1, settings.workday_page_concurrency)
+                delay, burst = delay / pages, max(burst, pages)
+        return (1 / delay if delay > 0 else 0.0), burst
+
+    async def acquire(self, host: str) -> None:
+        """Wait until a request to `host` is allowed."""
+        host = host.lower()
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(*self._limits(host))
+        waited = await bucket.acquire()
+        if waited:
+            logger.debug("Rate limited %s for %.2fs", host, waited)
+
+
+rate_limiter = HostRateLimiter()
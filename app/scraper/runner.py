@@ -5,19 +5,37 @@ The dispatcher inspects each source URL and routes it to the right scraper:
   - everything else    →  GenericScraper  (Playwright heuristic)
 """
 
-from datetime import datetime, timezone
+import asyncio
+from collections import defaultdict
+from contextlib import aclosing
+from datetime import datetime, timedelta, timezone
 import logging
+from urllib.parse import urlparse
 
-from sqlalchemy import select
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Job, JobStatus, Source
-from app.schemas import JobCreate, ScrapeResult
+from app.cache import JOBS_SCOPE, SOURCES_SCOPE
+from app.config import settings
+from app.database import ScrapeSessionLocal, commit_and_publish, mark_changed
+from app.models import Job, JobStatus, ScrapeRunSource, ScrapeRunStatus, Source
+from app.schemas import JobCreate
+from app.scraper.dedupe import canonicalize_url, job_fingerprint
 from app.scraper.generic import GenericScraper
+from app.scraper.process_pool import scrape_process_pool
 from app.scraper.workday import WorkdayScraper
+from app.stats import record_new_jobs
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT statement; keeps bind parameters well under asyncpg's 32767 limit.
+_INSERT_CHUNK_SIZE = 1000
+
+# Source scrapes in flight in this process, across scheduled runs and every
+# submitted run; each holds a scrape-pool connection (see app.database).
+_scrape_slots = asyncio.Semaphore(max(1, settings.scraper_max_concurrency))
+
 
 def _is_antibot_error(message: str) -> bool:
     msg = message.lower()
@@ -33,6 +51,10 @@ def _is_workday(url: str) -> bool:
     return "myworkdayjobs.com" in url.lower()
 
 
+def source_host(base_url: str) -> str:
+    return (urlparse(base_url).hostname or base_url).lower()
+
+
 def _build_scraper(source: Source) -> GenericScraper | WorkdayScraper:
     if _is_workday(source.base_url):
         return WorkdayScraper(
@@ -46,51 +68,186 @@ def _build_scraper(source: Source) -> GenericScraper | WorkdayScraper:
         keyword=source.keyword,
         query_param=source.query_param,
         url_path_filter=source.url_path_filter,
+        resource_profile=source.resource_profile,
     )
 
 
-async def _save_new_jobs(jobs: list[JobCreate], db: AsyncSession) -> int:
-    """Insert jobs that don't already exist (deduped by URL). Returns count inserted."""
-    new_count = 0
+async def _save_new_jobs(
+    jobs: list[JobCreate], db: AsyncSession, source_id: int | None = None
+) -> tuple[int, set[str]]:
+    """Insert jobs that aren't already stored.
+
+    Returns (count inserted, canonical URLs of the jobs skipped as duplicates).
+
+    A job is a duplicate if its canonical URL matches one already stored (one
+    indexed lookup per chunk) or earlier in the batch, or if its fingerprint
+    matches a job stored by another source, i.e. the same role mirrored on a
+    different board. Same-source fingerprint matches are kept: they are
+    distinct openings with the same title, or reposts. The rest go through
+    one `INSERT ... ON CONFLICT (url) DO NOTHING RETURNING id` per chunk, so
+    the returned rows are exactly the newly inserted jobs; those are then
+    counted into the statistics rollups.
+    """
+    rows: dict[str, dict[str, object]] = {}
     for job in jobs:
         url_str = str(job.url)
-        existing = await db.scalar(select(Job).where(Job.url == url_str))
-        if existing is None:
-            db.add(
-                Job(
-                    title=job.title,
-                    company=job.company,
-                    location=job.location,
-                    url=url_str,
-                    description=job.description,
-                    source=job.source,
-                    status=JobStatus.NEW,
+        canonical = canonicalize_url(url_str)
+        if canonical in rows:
+            continue
+        fingerprint = job_fingerprint(job.title, job.company, job.location)
+        rows[canonical] = {
+            "title": job.title,
+            "company": job.company,
+            "location": job.location,
+            "url": url_str,
+            "canonical_url": canonical,
+            "fingerprint": fingerprint,
+            "description": job.description,
+            "source": job.source,
+            "source_id": source_id,
+            "status": JobStatus.NEW,
+        }
+
+    values = list(rows.values())
+    new_count = 0
+    duplicates: set[str] = set()
+    for start in range(0, len(values), _INSERT_CHUNK_SIZE):
+        chunk = values[start : start + _INSERT_CHUNK_SIZE]
+        fingerprints = [row["fingerprint"] for row in chunk if row["fingerprint"]]
+        stored = await db.execute(
+            select(Job.canonical_url, Job.fingerprint, Job.source_id).where(
+                or_(
+                    Job.canonical_url.in_([row["canonical_url"] for row in chunk]),
+                    and_(
+                        Job.fingerprint.in_(fingerprints),
+                        Job.source_id.is_distinct_from(source_id),
+                    ),
                 )
             )
-            new_count += 1
-    await db.flush()
-    return new_count
+        )
+        stored_urls: set[str | None] = set()
+        mirrored_fingerprints: set[str | None] = set()
+        for stored_url, fingerprint, stored_source_id in stored.tuples():
+            stored_urls.add(stored_url)
+            if fingerprint and stored_source_id != source_id:
+                mirrored_fingerprints.add(fingerprint)
+        fresh = []
+        for row in chunk:
+            if row["canonical_url"] in stored_urls or row["fingerprint"] in mirrored_fingerprints:
+                duplicates.add(str(row["canonical_url"]))
+            else:
+                fresh.append(row)
+        if not fresh:
+            continue
+
+        stmt = (
+            pg_insert(Job)
+            .values(fresh)
+            .on_conflict_do_nothing(index_elements=[Job.url])
+            .returning(Job.id, Job.canonical_url)
+        )
+        inserted = (await db.execute(stmt)).tuples().all()
+        # Rows that lost the URL conflict to a concurrent insert are duplicates too.
+        inserted_urls = {canonical_url for _, canonical_url in inserted}
+        duplicates.update(
+            str(row["canonical_url"]) for row in fresh if row["canonical_url"] not in inserted_urls
+        )
+        new_ids = [job_id for job_id, _ in inserted]
+        await record_new_jobs(db, new_ids)
+        new_count += len(new_ids)
+    if new_count:
+        mark_changed(db, JOBS_SCOPE)
+    return new_count, duplicates
+
+
+async def _load_known_urls(source: Source, db: AsyncSession) -> set[str]:
+    """Return the canonical URLs of the jobs stored for `source`."""
+    result = await db.scalars(
+        select(Job.canonical_url).where(
+            Job.source_id == source.id, Job.canonical_url.is_not(None)
+        )
+    )
+    return {url for url in result if url is not None}
+
+
+def _needs_full_sweep(source: Source, now_utc: datetime) -> bool:
+    """Whether this run must walk every page instead of stopping at known URLs."""
+    if not settings.scraper_incremental or source.last_full_scrape_at is None:
+        return True
+    sweep_every = timedelta(hours=settings.scraper_full_sweep_hours)
+    return now_utc - source.last_full_scrape_at >= sweep_every
 
 
 async def run_source(
     source: Source, db: AsyncSession
-) -> tuple[int, int, list[str]]:
-    """Run scraper for a single source. Returns (jobs_found, jobs_new, errors)."""
+) -> tuple[int, int, int, list[str]]:
+    """Run scraper for a single source.
+
+    Returns (jobs_found, jobs_new, blocked_requests, errors), where
+    `blocked_requests` counts the browser requests aborted by the source's
+    resource profile.
+
+    `db` must be a session of the source's own: each batch the scraper
+    yields is saved under a savepoint and committed, so no transaction stays
+    open while pages are fetched and a failure part-way through keeps the
+    batches already saved (and they are included in the returned counts).
+
+    In incremental mode (`SCRAPER_INCREMENTAL`), pagination stops once
+    `SCRAPER_KNOWN_PAGES_TO_STOP` consecutive batches contain only known jobs:
+    canonical URLs already stored for this source, or jobs skipped as
+    duplicates of stored ones (e.g. mirrored from another source); a full
+    sweep still runs every `SCRAPER_FULL_SWEEP_HOURS` to catch reordered
+    listings.
+    """
     errors: list[str] = []
     jobs_found = 0
     jobs_new = 0
 
+    started_at = datetime.now(timezone.utc)
+    full_sweep = _needs_full_sweep(source, started_at)
+    known_urls = set() if full_sweep else await _load_known_urls(source, db)
+    known_pages = 0
+
     scraper = _build_scraper(source)
     try:
-        async with scraper:
-            jobs = await scraper.scrape()
-        jobs_found = len(jobs)
-        jobs_new = await _save_new_jobs(jobs, db)
+        async with scraper, aclosing(scraper.scrape_batches()) as batches:
+            async for batch in batches:
+                async with db.begin_nested():
+                    batch_new, duplicates = await _save_new_jobs(batch, db, source_id=source.id)
+                await commit_and_publish(db)
+                jobs_found += len(batch)
+                jobs_new += batch_new
+                logger.debug(
+                    "Source '%s' checkpoint: found=%s new=%s",
+                    source.name,
+                    jobs_found,
+                    jobs_new,
+                )
+
+                if full_sweep:
+                    continue
+                # Jobs skipped as duplicates (stored earlier, or mirrored from
+                # another source) are known even if this source never stored them.
+                known_urls |= duplicates
+                if all(canonicalize_url(str(job.url)) in known_urls for job in batch):
+                    known_pages += 1
+                else:
+                    known_pages = 0
+                if known_pages >= settings.scraper_known_pages_to_stop:
+                    logger.info(
+                        "Source '%s': stopping after %s pages of known jobs",
+                        source.name,
+                        known_pages,
+                    )
+                    break
         source.is_blocked = False
         source.blocked_reason = None
         source.blocked_at = None
         source.last_error = None
         source.last_scraped_at = datetime.now(timezone.utc)
+        mark_changed(db, SOURCES_SCOPE)
+        if full_sweep:
+            source.last_full_scrape_at = started_at
         await db.flush()
     except Exception as exc:
         logger.exception("Scrape failed for source '%s' (%s)", source.name, source.base_url)
@@ -106,29 +263,129 @@ async def run_source(
             )
         else:
             errors.append(f"[{source.name}] {exc}")
+        mark_changed(db, SOURCES_SCOPE)
         await db.flush()
 
-    return jobs_found, jobs_new, errors
+    blocked_requests = 0
+    if isinstance(scraper, GenericScraper) and scraper.blocked_requests:
+        blocked_requests = scraper.blocked_requests
+        logger.info(
+            "Source '%s' blocked %s requests (%s profile)",
+            source.name,
+            blocked_requests,
+            scraper.resource_profile,
+        )
+    return jobs_found, jobs_new, blocked_requests, errors
+
+
+async def _mark_run_item(
+    db: AsyncSession, run_id: int, source_id: int, **values: object
+) -> None:
+    await db.execute(
+        update(ScrapeRunSource)
+        .where(ScrapeRunSource.run_id == run_id, ScrapeRunSource.source_id == source_id)
+        .values(**values)
+    )
+
 
+async def run_source_isolated(
+    source_id: int, run_id: int | None = None
+) -> tuple[int, int, list[str]]:
+    """Run one source on its own session so a failure can't poison other sources.
+
+    When `run_id` is given, the source's row in `scrape_run_sources` is moved
+    to running before scraping and finalized in the same transaction as the
+    source's final state.
+    """
+    async with ScrapeSessionLocal() as db:
+        source = await db.get(Source, source_id)
+        if source is None:
+            return 0, 0, []
+        source_name = source.name
+        if run_id is not None:
+            await _mark_run_item(
+                db,
+                run_id,
+                source_id,
+                status=ScrapeRunStatus.RUNNING,
+                started_at=datetime.now(timezone.utc),
+            )
+            await db.commit()
+        try:
+            found, new, blocked, errors = await run_source(source, db)
+            if run_id is not None:
+                await _mark_run_item(
+                    db,
+                    run_id,
+                    source_id,
+                    status=ScrapeRunStatus.FAILED if errors else ScrapeRunStatus.COMPLETED,
+                    jobs_found=found,
+                    jobs_new=new,
+                    blocked_requests=blocked,
+                    error="\n".join(errors) or None,
+                    finished_at=datetime.now(timezone.utc),
+                )
+            await commit_and_publish(db)
+        except Exception as exc:
+            await db.rollback()
+            logger.exception("Scrape transaction failed for source '%s'", source_name)
+            errors = [f"[{source_name}] {exc}"]
+            if run_id is not None:
+                await _mark_run_item(
+                    db,
+                    run_id,
+                    source_id,
+                    status=ScrapeRunStatus.FAILED,
+                    error=errors[0],
+                    finished_at=datetime.now(timezone.utc),
+                )
+                await db.commit()
+            return 0, 0, errors
+        return found, new, errors
 
-async def run_all_sources(db: AsyncSession) -> ScrapeResult:
-    """Run scrapers for all active sources and return aggregated stats."""
-    result = await db.execute(select(Source).where(Source.is_active.is_(True)))
-    sources = list(result.scalars().all())
 
-    total_found = 0
-    total_new = 0
-    all_errors: list[str] = []
+async def dispatch_source(
+    source_id: int, base_url: str, run_id: int | None = None
+) -> tuple[int, int, list[str]]:
+    """Run one source like `run_source_isolated`.
+
+    At most `SCRAPER_MAX_CONCURRENCY` sources run at once per process, however
+    many runs and scheduled scrapes are active. Browser-based sources go to
+    the scrape process pool when it is running (see `app.worker`); everything
+    else runs in this process.
+    """
+    async with _scrape_slots:
+        if scrape_process_pool.running and not _is_workday(base_url):
+            return await scrape_process_pool.run(source_id, run_id)
+        return await run_source_isolated(source_id, run_id)
+
+
+async def run_sources_concurrently(
+    sources: list[Source],
+    max_concurrency: int,
+    max_per_host: int,
+    run_id: int | None = None,
+) -> list[tuple[int, int, list[str]]]:
+    """Run sources in parallel, bounded globally and per hostname."""
+    global_limit = asyncio.Semaphore(max(1, max_concurrency))
+    host_limits: defaultdict[str, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(max(1, max_per_host))
+    )
 
-    for source in sources:
-        found, new, errors = await run_source(source, db)
-        total_found += found
-        total_new += new
-        all_errors.extend(errors)
+    async def _bounded(
+        source_id: int, source_name: str, base_url: str
+    ) -> tuple[int, int, list[str]]:
+        # Take the host slot first so sources queued behind a busy host
+        # don't hold a global slot while they wait.
+        async with host_limits[source_host(base_url)], global_limit:
+            try:
+                return await dispatch_source(source_id, base_url, run_id)
+            except Exception as exc:
+                # Reported like any other source failure, so one source can't
+                # abort the gather while its siblings keep scraping.
+                logger.exception("Scrape of source '%s' failed", source_name)
+                return 0, 0, [f"[{source_name}] {exc}"]
 
-    return ScrapeResult(
-        sources_processed=len(sources),
-        jobs_found=total_found,
-        jobs_new=total_new,
-        errors=all_errors,
+    return await asyncio.gather(
+        *(_bounded(source.id, source.name, source.base_url) for source in sources)
     )
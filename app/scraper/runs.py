@@ -0,0 +1,265 @@
+"""Background scrape runs submitted through the API.
+
+`create_run` records a pending `ScrapeRun` with one `ScrapeRunSource` row per
+source and the HTTP request returns immediately with the run id. A `RunQueue`
+(inside the API process, or in `app.worker` when scraping runs separately)
+claims pending runs from the database and executes them; progress is read
+back from the database.
+
+A run is claimed with `UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP
+LOCKED)`, which records a lease on the row like the scheduler's source
+leases, so any number of processes can share the queue. The lease is renewed
+while the run executes; a run whose lease expired was left by a process that
+died and is failed as interrupted.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+import logging
+import os
+import socket
+import uuid
+
+from sqlalchemy import ColumnElement, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import ScrapeSessionLocal
+from app.models import ScrapeRun, ScrapeRunSource, ScrapeRunStatus, Source
+from app.scraper.runner import run_sources_concurrently
+
+logger = logging.getLogger(__name__)
+
+_ERROR_RETRY_SECONDS = 20
+_UNFINISHED = (ScrapeRunStatus.PENDING, ScrapeRunStatus.RUNNING)
+
+
+async def create_run(db: AsyncSession, sources: list[Source]) -> ScrapeRun:
+    """Persist a pending run covering the given sources."""
+    run = ScrapeRun(
+        status=ScrapeRunStatus.PENDING,
+        sources_processed=len(sources),
+        errors=[],
+        sources=[
+            ScrapeRunSource(
+                source_id=source.id,
+                source_name=source.name,
+                status=ScrapeRunStatus.PENDING,
+            )
+            for source in sources
+        ],
+    )
+    db.add(run)
+    await db.flush()
+    await db.refresh(run)
+    return run
+
+
+async def execute_run(run_id: int) -> None:
+    """Scrape every source in the run, each on its own session, and record totals."""
+    async with ScrapeSessionLocal() as db:
+        run = await db.get(ScrapeRun, run_id)
+        if run is None:
+            return
+        source_ids = [item.source_id for item in run.sources if item.source_id is not None]
+        result = await db.execute(select(Source).where(Source.id.in_(source_ids)))
+        by_id = {source.id: source for source in result.scalars().all()}
+        sources = [by_id[source_id] for source_id in source_ids if source_id in by_id]
+
+    try:
+        outcomes = await run_sources_concurrently(
+            sources,
+            max_concurrency=settings.scraper_max_concurrency,
+            max_per_host=settings.scraper_max_per_host,
+            run_id=run_id,
+        )
+    except Exception as exc:
+        logger.exception("Scrape run %s failed", run_id)
+        await _fail_runs(ScrapeRun.id == run_id, error=str(exc))
+        return
+
+    async with ScrapeSessionLocal() as db:
+        run = await db.get(ScrapeRun, run_id)
+        if run is None:
+            return
+        run.jobs_found = sum(found for found, _, _ in outcomes)
+        run.jobs_new = sum(new for _, new, _ in outcomes)
+        run.errors = [err for _, _, errors in outcomes for err in errors]
+        run.finished_at = datetime.now(timezone.utc)
+        errors_by_source: dict[int | None, list[str]] = {
+            source.id: errors for source, (_, _, errors) in zip(sources, outcomes)
+        }
+        # Items still unfinished never recorded their own result: the scrape
+        # was lost (e.g. its child process died) or the source was deleted
+        # between submission and execution.
+        for item in run.sources:
+            if item.status not in _UNFINISHED:
+                continue
+            errors = errors_by_source.get(item.source_id)
+            item.status = ScrapeRunStatus.FAILED
+            item.error = "\n".join(errors) if errors else "Source no longer exists"
+            item.finished_at = run.finished_at
+        # A run only fails as a whole when none of its sources succeeded;
+        # partial failures are reported per source and in `errors`.
+        all_failed = bool(run.sources) and all(
+            item.status == ScrapeRunStatus.FAILED for item in run.sources
+        )
+        run.status = ScrapeRunStatus.FAILED if all_failed else ScrapeRunStatus.COMPLETED
+        await db.commit()
+        logger.info(
+            "Scrape run %s finished: sources=%s found=%s new=%s errors=%s",
+            run_id,
+            run.sources_processed,
+            run.jobs_found,
+            run.jobs_new,
+            len(run.errors),
+        )
+
+
+async def _fail_runs(*conditions: ColumnElement[bool], error: str = "Interrupted") -> None:
+    """Fail running runs matching `conditions`, and their unfinished sources."""
+    now_utc = datetime.now(timezone.utc)
+    runs = select(ScrapeRun.id).where(ScrapeRun.status == ScrapeRunStatus.RUNNING, *conditions)
+    async with ScrapeSessionLocal() as db:
+        await db.execute(
+            update(ScrapeRunSource)
+            .where(
+                ScrapeRunSource.run_id.in_(runs.scalar_subquery()),
+                ScrapeRunSource.status.in_(_UNFINISHED),
+            )
+            .values(status=ScrapeRunStatus.FAILED, error=error, finished_at=now_utc)
+        )
+        await db.execute(
+            update(ScrapeRun)
+            .where(ScrapeRun.id.in_(runs.scalar_subquery()))
+            .values(status=ScrapeRunStatus.FAILED, errors=[error], finished_at=now_utc)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+
+async def fail_interrupted_runs() -> None:
+    """Fail runs whose executing process died (their lease expired)."""
+    await _fail_runs(
+        or_(ScrapeRun.lease_expires_at.is_(None), ScrapeRun.lease_expires_at < func.now())
+    )
+
+
+class RunQueue:
+    """Claims pending runs from the database and executes them."""
+
+    def __init__(self) -> None:
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._task: asyncio.Task[None] | None = None
+        self._wakeup = asyncio.Event()
+        self._running: dict[int, asyncio.Task[None]] = {}
+
+    async def start(self) -> None:
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._loop(), name="scrape-run-queue")
+        logger.info("Scrape run queue started (worker %s)", self.worker_id)
+
+    async def halt(self) -> None:
+        """Stop claiming runs and cancel in-flight ones, keeping their leases."""
+        if not self._task:
+            return
+        tasks = [self._task, *self._running.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def stop(self) -> None:
+        """Halt, then mark this worker's unfinished runs as interrupted."""
+        if not self._task:
+            return
+        await self.halt()
+        try:
+            await _fail_runs(ScrapeRun.lease_owner == self.worker_id)
+        except Exception:
+            logger.warning("Failed to mark interrupted runs", exc_info=True)
+        logger.info("Scrape run queue stopped")
+
+    def wake(self) -> None:
+        """Look for pending runs now (call after submitting one)."""
+        self._wakeup.set()
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                self._wakeup.clear()
+                await fail_interrupted_runs()
+                # Bound runs per process so other processes share the queue;
+                # each run is itself bounded by SCRAPER_MAX_CONCURRENCY.
+                while len(self._running) < max(1, settings.scraper_max_concurrency):
+                    run_id = await self._claim()
+                    if run_id is None:
+                        break
+                    self._running[run_id] = asyncio.create_task(
+                        self._execute(run_id), name=f"scrape-run-{run_id}"
+                    )
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=settings.worker_poll_seconds
+                    )
+                except TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Unexpected run queue error")
+                await asyncio.sleep(_ERROR_RETRY_SECONDS)
+
+    async def _claim(self) -> int | None:
+        """Lease the oldest pending run and mark it running."""
+        lease = timedelta(seconds=settings.scheduler_lease_seconds)
+        pending = (
+            select(ScrapeRun.id)
+            .where(ScrapeRun.status == ScrapeRunStatus.PENDING)
+            .order_by(ScrapeRun.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        async with ScrapeSessionLocal() as db:
+            run_id = await db.scalar(
+                update(ScrapeRun)
+                .where(ScrapeRun.id.in_(pending.scalar_subquery()))
+                .values(
+                    status=ScrapeRunStatus.RUNNING,
+                    started_at=func.now(),
+                    lease_owner=self.worker_id,
+                    lease_expires_at=func.now() + lease,
+                )
+                .returning(ScrapeRun.id)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        return run_id
+
+    async def _execute(self, run_id: int) -> None:
+        renewal = asyncio.create_task(self._renew_lease(run_id))
+        try:
+            await execute_run(run_id)
+        finally:
+            renewal.cancel()
+            self._running.pop(run_id, None)
+            self.wake()
+
+    async def _renew_lease(self, run_id: int) -> None:
+        """Extend this worker's lease on a run while it executes."""
+        lease = timedelta(seconds=settings.scheduler_lease_seconds)
+        while True:
+            await asyncio.sleep(lease.total_seconds() / 3)
+            try:
+                async with ScrapeSessionLocal() as db:
+                    await db.execute(
+                        update(ScrapeRun)
+                        .where(ScrapeRun.id == run_id, ScrapeRun.lease_owner == self.worker_id)
+                        .values(lease_expires_at=func.now() + lease)
+                    )
+                    await db.commit()
+            except Exception:
+                logger.warning("Failed to renew lease on run %s", run_id, exc_info=True)
+
+
+run_queue = RunQueue()
@@ -8,20 +8,30 @@ request looks identical to a normal browser visit. No authentication is required
 for public job boards.
 
 Rate-limiting notes:
-- Keep SCRAPER_DELAY_SECONDS >= 2 between pagination requests.
+- Every request goes through the shared per-host rate limiter (see
+  `app.scraper.rate_limit`); keep SCRAPER_DELAY_SECONDS >= 2 for Workday hosts.
+- With WORKDAY_PAGE_CONCURRENCY > 1 the remaining offsets are fetched in
+  parallel. Unless overridden, Workday hosts' buckets allow that many
+  requests per SCRAPER_DELAY_SECONDS, so the tenant sees the same pacing as
+  a dedicated per-scrape limiter would give.
 - Running once or twice per day per source is well within safe limits.
 """
 
 import asyncio
+from collections.abc import AsyncIterator
 import re
+from typing import Any
 from urllib.parse import urlparse
 
 import httpx
 
 from app.config import settings
 from app.schemas import JobCreate
+from app.scraper.http_pool import HttpClientPool, http_pool
 
 _LOCALE_RE = re.compile(r"^[a-z]{2}-[A-Z]{2}$")
+# Page size the Workday board UI itself requests; always accepted.
+_DEFAULT_PAGE_SIZE = 20
 
 
 def _parse_workday_url(url: str) -> tuple[str, str, str]:
@@ -51,73 +61,151 @@ class WorkdayScraper:
         self._source_name = source_name
         self._base_url = base_url
         self._keyword = keyword
-        self._client: httpx.AsyncClient | None = None
+        self._client: HttpClientPool | None = None
 
     async def __aenter__(self) -> "WorkdayScraper":
-        self._client = httpx.AsyncClient(
+        self._client = http_pool
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        # The shared pool outlives the scraper; connections stay warm for the next source.
+        self._client = None
+
+    async def _fetch_page(self, api_url: str, offset: int, limit: int) -> dict[str, Any]:
+        if self._client is None:
+            raise RuntimeError("Use `async with WorkdayScraper(...)` context manager.")
+        response = await self._client.post(
+            api_url,
             headers={
-                "User-Agent": (
-                    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                ),
                 "Accept": "application/json",
                 "Content-Type": "application/json",
                 # Referer makes the request look like it came from the job board page
                 "Referer": self._base_url,
             },
-            timeout=settings.scraper_timeout_seconds,
+            json={
+                "appliedFacets": {},
+                "limit": limit,
+                "offset": offset,
+                "searchText": self._keyword,
+            },
         )
-        return self
-
-    async def __aexit__(self, *args: object) -> None:
-        if self._client:
-            await self._client.aclose()
-
-    async def scrape(self) -> list[JobCreate]:
-        if self._client is None:
-            raise RuntimeError("Use `async with WorkdayScraper(...)` context manager.")
-
-        api_base, tenant, jobsite = _parse_workday_url(self._base_url)
-        api_url = f"{api_base}/wday/cxs/{tenant}/{jobsite}/jobs"
-
+        response.raise_for_status()
+        return response.json()
+
+    async def _fetch_first_page(self, api_url: str) -> tuple[dict[str, Any], int]:
+        """Fetch offset 0 with the largest accepted page size. Returns (data, limit)."""
+        limit = max(1, settings.workday_page_size)
+        try:
+            return await self._fetch_page(api_url, 0, limit), limit
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code != 400 or limit <= _DEFAULT_PAGE_SIZE:
+                raise
+        # Tenant rejected the larger page size; fall back to the board's own default.
+        return await self._fetch_page(api_url, 0, _DEFAULT_PAGE_SIZE), _DEFAULT_PAGE_SIZE
+
+    def _postings_to_jobs(
+        self, api_base: str, postings: list[dict[str, Any]]
+    ) -> list[JobCreate]:
         jobs: list[JobCreate] = []
+        for posting in postings:
+            external_path = posting.get("externalPath", "")
+            job_url = f"{api_base}{external_path}"
+            jobs.append(
+                JobCreate(
+                    title=posting.get("title", "Unknown"),
+                    company=self._source_name,
+                    location=posting.get("locationsText"),
+                    url=job_url,
+                    source=self._source_name,
+                )
+            )
+        return jobs
+
+    async def _scrape_sequential(
+        self,
+        api_url: str,
+        api_base: str,
+        first: dict[str, Any],
+        limit: int,
+    ) -> AsyncIterator[list[JobCreate]]:
+        data = first
         offset = 0
-        limit = 20
 
         while True:
-            response = await self._client.post(
-                api_url,
-                json={
-                    "appliedFacets": {},
-                    "limit": limit,
-                    "offset": offset,
-                    "searchText": self._keyword,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-
             postings = data.get("jobPostings", [])
             if not postings:
                 break
 
-            for posting in postings:
-                external_path = posting.get("externalPath", "")
-                job_url = f"{api_base}{external_path}"
-                jobs.append(
-                    JobCreate(
-                        title=posting.get("title", "Unknown"),
-                        company=self._source_name,
-                        location=posting.get("locationsText"),
-                        url=job_url,
-                        source=self._source_name,
-                    )
-                )
+            yield self._postings_to_jobs(api_base, postings)
 
             offset += limit
             if offset >= data.get("total", 0):
                 break
 
-            await asyncio.sleep(settings.scraper_delay_seconds)
+            data = await self._fetch_page(api_url, offset, limit)
+
+    async def _scrape_fan_out(
+        self,
+        api_url: str,
+        api_base: str,
+        first: dict[str, Any],
+        limit: int,
+    ) -> AsyncIterator[list[JobCreate]]:
+        """Fetch every remaining offset concurrently, paced by the host's rate limit.
+
+        Pages are yielded in offset order as soon as each one (and all before
+        it) has arrived, deduplicated by URL.
+        """
+        total = first.get("total", 0)
+        offsets = range(limit, total, limit)
+        in_flight = asyncio.Semaphore(settings.workday_page_concurrency)
+
+        async def _bounded_fetch(offset: int) -> list[dict[str, Any]]:
+            async with in_flight:
+                data = await self._fetch_page(api_url, offset, limit)
+                return data.get("jobPostings", [])
+
+        seen_urls: set[str] = set()
+
+        def _dedupe(postings: list[dict[str, Any]]) -> list[JobCreate]:
+            jobs: list[JobCreate] = []
+            for job in self._postings_to_jobs(api_base, postings):
+                url_str = str(job.url)
+                if url_str in seen_urls:
+                    continue
+                seen_urls.add(url_str)
+                jobs.append(job)
+            return jobs
+
+        tasks = [asyncio.create_task(_bounded_fetch(offset)) for offset in offsets]
+        try:
+            batch = _dedupe(first.get("jobPostings", []))
+            if batch:
+                yield batch
+            for task in tasks:
+                batch = _dedupe(await task)
+                if batch:
+                    yield batch
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def scrape_batches(self) -> AsyncIterator[list[JobCreate]]:
+        """Yield postings page by page as they are fetched."""
+        if self._client is None:
+            raise RuntimeError("Use `async with WorkdayScraper(...)` context manager.")
 
-        return jobs
+        api_base, tenant, jobsite = _parse_workday_url(self._base_url)
+        api_url = f"{api_base}/wday/cxs/{tenant}/{jobsite}/jobs"
+
+        first, limit = await self._fetch_first_page(api_url)
+        if settings.workday_page_concurrency > 1:
+            pages = self._scrape_fan_out(api_url, api_base, first, limit)
+        else:
+            pages = self._scrape_sequential(api_url, api_base, first, limit)
+        async for batch in pages:
+            yield batch
+
+    async def scrape(self) -> list[JobCreate]:
+        return [job async for batch in self.scrape_batches() for job in batch]
@@ -67,6 +67,7 @@ class JobsView extends HTMLElement {
 
     const rows = jobs.map((j) => `
       <tr>
+        <td><input type="checkbox" class="row-check" data-id="${j.id}"></td>
         <td class="col-title"><a href="${esc(j.url)}" target="_blank" rel="noopener">${esc(j.title)}</a></td>
         <td>${esc(j.company)}</td>
         <td class="muted">${j.location ? esc(j.location) : '—'}</td>
@@ -82,9 +83,17 @@ class JobsView extends HTMLElement {
 
     out.innerHTML = `
       <div class="card">
+        <div class="bulk-bar">
+          <span class="pager-info" id="bulk-count">0 selected</span>
+          <select class="s-select" id="bulk-status">
+            ${STATUSES.map((s) => `<option>${s}</option>`).join('')}
+          </select>
+          <button class="btn secondary sm" id="bulk-apply" disabled>Apply to selected</button>
+        </div>
         <table>
           <thead>
             <tr>
+              <th><input type="checkbox" id="check-all"></th>
               <th>Title</th><th>Company</th><th>Location</th>
               <th>Source</th><th>Scraped</th><th>Status</th><th>Change</th>
             </tr>
@@ -111,7 +120,42 @@ class JobsView extends HTMLElement {
       this.refresh();
     });
 
-    out.querySelectorAll('.s-select').forEach((sel) => {
+    const checks = [...out.querySelectorAll('.row-check')];
+    const checkAll = out.querySelector('#check-all');
+    const bulkCount = out.querySelector('#bulk-count');
+    const bulkApply = out.querySelector('#bulk-apply');
+
+    const syncSelection = () => {
+      const n = checks.filter((c) => c.checked).length;
+      bulkCount.textContent = `${n} selected`;
+      bulkApply.disabled = n === 0;
+      checkAll.checked = n > 0 && n === checks.length;
+    };
+
+    checks.forEach((c) => c.addEventListener('change', syncSelection));
+    checkAll.addEventListener('change', () => {
+      checks.forEach((c) => { c.checked = checkAll.checked; });
+      syncSelection();
+    });
+
+    bulkApply.addEventListener('click', async () => {
+      const ids = checks.filter((c) => c.checked).map((c) => Number(c.dataset.id));
+      const status = out.querySelector('#bulk-status').value;
+      bulkApply.disabled = true;
+      try {
+        const r = await api('/jobs/bulk-status', {
+          method: 'POST',
+          body: JSON.stringify({ ids, status }),
+        });
+        toast(`Marked ${r.updated} job${r.updated !== 1 ? 's' : ''} as ${status}`, 'ok');
+        await this.refresh();
+      } catch (err) {
+        toast('Bulk update failed: ' + err.message, 'err');
+        syncSelection();
+      }
+    });
+
+    out.querySelectorAll('tbody .s-select').forEach((sel) => {
       sel.addEventListener('change', async (e) => {
         const id = e.target.dataset.id;
         const status = e.target.value;
@@ -20,7 +20,7 @@ class SourcesView extends HTMLElement {
             </label>
           </div>
           <div class="schedule-field">
-            <label>Interval (minutes)</label>
+            <label>Default interval (minutes)</label>
             <input id="sch-interval" class="w-sm" type="number" min="5" value="60">
           </div>
           <button class="btn secondary" id="save-schedule-btn">Save Schedule</button>
@@ -56,6 +56,19 @@ class SourcesView extends HTMLElement {
             <label>URL Path Filter</label>
             <input id="f-path-filter" class="w-md" type="text" placeholder="/job/ (optional)">
           </div>
+          <div class="fg">
+            <label>Resources</label>
+            <select id="f-resource-profile">
+              <option value="">Default</option>
+              <option value="minimal">Minimal</option>
+              <option value="css">Keep CSS</option>
+              <option value="full">Load all</option>
+            </select>
+          </div>
+          <div class="fg">
+            <label>Interval (min)</label>
+            <input id="f-interval" class="w-sm" type="number" min="5" placeholder="default">
+          </div>
           <button class="btn" id="save-source-btn">Add</button>
           <button class="btn secondary" id="cancel-edit-btn" hidden>Cancel</button>
         </div>
@@ -79,10 +92,11 @@ class SourcesView extends HTMLElement {
   }
 
   clearSourceForm() {
-    ['f-name', 'f-url', 'f-keyword', 'f-path-filter'].forEach((id) => {
+    ['f-name', 'f-url', 'f-keyword', 'f-path-filter', 'f-interval'].forEach((id) => {
       this.querySelector('#' + id).value = '';
     });
     this.querySelector('#f-param').value = 'q';
+    this.querySelector('#f-resource-profile').value = '';
   }
 
   beginEditSource(source) {
@@ -92,6 +106,8 @@ class SourcesView extends HTMLElement {
     this.querySelector('#f-keyword').value = source.keyword || '';
     this.querySelector('#f-param').value = source.query_param || 'q';
     this.querySelector('#f-path-filter').value = source.url_path_filter || '';
+    this.querySelector('#f-resource-profile').value = source.resource_profile || '';
+    this.querySelector('#f-interval').value = source.scrape_interval_minutes ?? '';
     this.setSourceFormMode();
     this.querySelector('#f-name').focus();
     this.querySelector('#f-name').scrollIntoView({ behavior: 'smooth', block: 'center' });
@@ -109,6 +125,9 @@ class SourcesView extends HTMLElement {
     const keyword = this.querySelector('#f-keyword').value.trim();
     const query_param = this.querySelector('#f-param').value.trim() || 'q';
     const url_path_filter = this.querySelector('#f-path-filter').value.trim() || null;
+    const resource_profile = this.querySelector('#f-resource-profile').value || null;
+    const rawInterval = this.querySelector('#f-interval').value;
+    const scrape_interval_minutes = rawInterval ? Math.max(5, Number(rawInterval)) : null;
 
     if (!name || !base_url || !keyword) {
       toast('Name, URL, and keyword are required', 'err');
@@ -116,7 +135,10 @@ class SourcesView extends HTMLElement {
     }
 
     try {
-      const payload = { name, base_url, keyword, query_param, url_path_filter };
+      const payload = {
+        name, base_url, keyword, query_param, url_path_filter, resource_profile,
+        scrape_interval_minutes,
+      };
       if (this.editingSourceId !== null) {
         await api('/sources/' + this.editingSourceId, {
           method: 'PATCH',
@@ -213,7 +235,10 @@ class SourcesView extends HTMLElement {
             : `<span class="badge ${s.is_active ? 's-applied' : 's-ignored'}">${s.is_active ? 'active' : 'paused'}</span>`
           }
         </td>
-        <td class="muted small">${fmtDate(s.last_scraped_at)}</td>
+        <td class="muted small">
+          ${fmtDate(s.last_scraped_at)}
+          ${s.current_interval_minutes ? `<div title="${esc(s.interval_reason || '')}">every ${s.current_interval_minutes} min</div>` : ''}
+        </td>
         <td>
           <label class="toggle">
             <input type="checkbox" class="act-toggle" data-sid="${s.id}" ${s.is_active ? 'checked' : ''}>
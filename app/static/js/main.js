@@ -9,6 +9,22 @@ const jobsView = document.getElementById('jobs-view');
 const sourcesView = document.getElementById('sources-view');
 const logsView = document.getElementById('logs-view');
 
+const RUN_POLL_MS = 2000;
+
+function sleep(ms) {
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+async function waitForRun(run, statusEl) {
+  while (run.status === 'pending' || run.status === 'running') {
+    const done = run.sources.filter((s) => s.status === 'completed' || s.status === 'failed').length;
+    statusEl.textContent = `Scraping… ${done}/${run.sources.length}`;
+    await sleep(RUN_POLL_MS);
+    run = await api('/scrape/runs/' + run.id);
+  }
+  return run;
+}
+
 async function runScrape(path, triggerBtn) {
   const runAllBtn = document.getElementById('run-all-btn');
   const statusEl = document.getElementById('scrape-status');
@@ -20,7 +36,8 @@ async function runScrape(path, triggerBtn) {
   statusEl.textContent = 'Scraping…';
 
   try {
-    const r = await api(path, { method: 'POST' });
+    const submitted = await api(path, { method: 'POST' });
+    const r = await waitForRun(submitted, statusEl);
     statusEl.textContent = '';
     const msg = `${r.jobs_new} new job${r.jobs_new !== 1 ? 's' : ''} across ${r.sources_processed} source${r.sources_processed !== 1 ? 's' : ''}`;
     toast(msg, 'ok');
@@ -0,0 +1,198 @@
+"""Precomputed job statistics kept in the `job_daily_stats` rollup table.
+
+Rollups count jobs per (source, UTC scrape day, status) and are updated in the
+same transaction as the change they reflect: ingestion counts new jobs, status
+updates move counts between statuses, and deleting a source folds its rows
+into the unattributed bucket (`source_id` 0, matching the jobs whose source is
+cleared by the foreign key).
+
+`rebuild_rollups` recomputes everything from `jobs`. From the command line:
+
+    python -m app.stats rebuild   # recompute the rollups from scratch
+    python -m app.stats check     # report drift without changing anything
+"""
+
+import argparse
+import asyncio
+from collections import Counter
+from collections.abc import Iterable
+from datetime import date, datetime, timezone
+import logging
+import sys
+
+from sqlalchemy import (
+    ColumnElement,
+    Date,
+    Select,
+    cast,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import Insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import AsyncSessionLocal, engine
+from app.logging_utils import configure_logging
+from app.models import Job, JobDailyStat, JobStatus
+
+logger = logging.getLogger(__name__)
+
+UNATTRIBUTED_SOURCE_ID = 0
+
+_ROLLUP_COLUMNS = ["source_id", "day", "status", "job_count"]
+
+# Rows per upsert statement; 4 bind parameters per row.
+_UPSERT_CHUNK_SIZE = 1000
+
+RollupKey = tuple[int, date, JobStatus]
+
+
+def _rollup_select(*conditions: ColumnElement[bool]) -> Select:
+    # Literal constants (not bind parameters) so GROUP BY matches the select list.
+    source_id = func.coalesce(Job.source_id, literal_column(str(UNATTRIBUTED_SOURCE_ID)))
+    day = cast(func.timezone(literal_column("'UTC'"), Job.scraped_at), Date)
+    return (
+        select(source_id, day, Job.status, func.count())
+        .where(*conditions)
+        .group_by(source_id, day, Job.status)
+    )
+
+
+def _add_counts(stmt: Insert) -> Insert:
+    return stmt.on_conflict_do_update(
+        index_elements=[JobDailyStat.source_id, JobDailyStat.day, JobDailyStat.status],
+        set_={"job_count": JobDailyStat.job_count + stmt.excluded.job_count},
+    )
+
+
+async def record_new_jobs(db: AsyncSession, job_ids: list[int]) -> None:
+    """Count freshly inserted jobs into the rollups."""
+    if not job_ids:
+        return
+    stmt = pg_insert(JobDailyStat).from_select(
+        _ROLLUP_COLUMNS, _rollup_select(Job.id.in_(job_ids))
+    )
+    await db.execute(_add_counts(stmt))
+
+
+async def record_status_changes(
+    db: AsyncSession,
+    changes: Iterable[tuple[int | None, datetime, JobStatus, JobStatus]],
+) -> None:
+    """Move rollup counts for jobs whose status changed.
+
+    Each change is `(source_id, scraped_at, old_status, new_status)`.
+    """
+    deltas: Counter[RollupKey] = Counter()
+    for source_id, scraped_at, old_status, new_status in changes:
+        if old_status == new_status:
+            continue
+        key_source = UNATTRIBUTED_SOURCE_ID if source_id is None else source_id
+        day = scraped_at.astimezone(timezone.utc).date()
+        deltas[(key_source, day, old_status)] -= 1
+        deltas[(key_source, day, new_status)] += 1
+
+    # Sorted so concurrent writers lock rollup rows in the same order.
+    rows = [
+        {"source_id": source_id, "day": day, "status": status, "job_count": count}
+        for (source_id, day, status), count in sorted(deltas.items())
+        if count
+    ]
+    for start in range(0, len(rows), _UPSERT_CHUNK_SIZE):
+        stmt = pg_insert(JobDailyStat).values(rows[start : start + _UPSERT_CHUNK_SIZE])
+        await db.execute(_add_counts(stmt))
+
+
+async def fold_source(db: AsyncSession, source_id: int) -> None:
+    """Move a deleted source's rollups into the unattributed bucket."""
+    moved = select(
+        literal_column(str(UNATTRIBUTED_SOURCE_ID)),
+        JobDailyStat.day,
+        JobDailyStat.status,
+        JobDailyStat.job_count,
+    ).where(JobDailyStat.source_id == source_id)
+    await db.execute(_add_counts(pg_insert(JobDailyStat).from_select(_ROLLUP_COLUMNS, moved)))
+    await db.execute(delete(JobDailyStat).where(JobDailyStat.source_id == source_id))
+
+
+async def rebuild_rollups(db: AsyncSession) -> int:
+    """Recompute every rollup row from `jobs`. Returns the number of rows written.
+
+    The table lock waits for in-flight writers and holds off new ones, so no
+    increment is lost or double counted while the rollups are rebuilt.
+    """
+    await db.execute(text("LOCK TABLE job_daily_stats IN EXCLUSIVE MODE"))
+    await db.execute(delete(JobDailyStat))
+    result = await db.execute(
+        insert(JobDailyStat).from_select(_ROLLUP_COLUMNS, _rollup_select())
+    )
+    return result.rowcount
+
+
+async def find_drift(db: AsyncSession) -> list[tuple[RollupKey, int, int]]:
+    """Compare the rollups against `jobs`; returns `(key, stored, actual)` mismatches."""
+    stored_rows = await db.execute(
+        select(
+            JobDailyStat.source_id,
+            JobDailyStat.day,
+            JobDailyStat.status,
+            JobDailyStat.job_count,
+        )
+    )
+    stored = {(s, d, st): count for s, d, st, count in stored_rows.tuples() if count}
+    actual_rows = await db.execute(_rollup_select())
+    actual = {(s, d, st): count for s, d, st, count in actual_rows.tuples()}
+    return [
+        (key, stored.get(key, 0), actual.get(key, 0))
+        for key in sorted(stored.keys() | actual.keys())
+        if stored.get(key, 0) != actual.get(key, 0)
+    ]
+
+
+async def _run_command(command: str) -> int:
+    try:
+        async with AsyncSessionLocal() as db:
+            if command == "rebuild":
+                rows = await rebuild_rollups(db)
+                await db.commit()
+                logger.info("Rebuilt job statistics: %s rollup rows", rows)
+                return 0
+
+            drift = await find_drift(db)
+            for (source_id, day, status), stored, actual in drift:
+                logger.warning(
+                    "Rollup drift source_id=%s day=%s status=%s: stored=%s actual=%s",
+                    source_id,
+                    day,
+                    status.value,
+                    stored,
+                    actual,
+                )
+            logger.info("Job statistics check: %s mismatched rollup rows", len(drift))
+            return 1 if drift else 0
+    finally:
+        await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.stats",
+        description="Maintain the precomputed job statistics rollups.",
+    )
+    parser.add_argument(
+        "command",
+        choices=["rebuild", "check"],
+        help="rebuild: recompute from jobs; check: report drift (exit 1 if any)",
+    )
+    args = parser.parse_args(argv)
+    configure_logging()
+    return asyncio.run(_run_command(args.command))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""Standalone scrape worker, separate from the API server.
+
+    python -m app.worker [--processes N]
+
+Runs the per-source scheduler and executes runs submitted through the API, so
+browser scraping never competes with request handling and the two can be
+scaled independently. Start the API with `SCRAPE_WORKER_EMBEDDED=false` so it
+only enqueues runs and reads results from the database. Any number of workers
+can share one database: scheduled sources and submitted runs are both claimed
+through database leases.
+
+With `--processes N` (default `WORKER_PROCESSES`), browser-based scrapes are
+fanned out to a pool of N child processes; Workday scrapes stay on the
+worker's event loop.
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+import sys
+
+from app.config import settings
+from app.database import engine, scrape_engine
+from app.logging_utils import configure_logging
+from app.scheduler import scrape_scheduler
+from app.scraper.browser_pool import browser_pool
+from app.scraper.http_pool import http_pool
+from app.scraper.process_pool import scrape_process_pool
+from app.scraper.runs import run_queue
+
+logger = logging.getLogger(__name__)
+
+
+async def _serve(processes: int) -> None:
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopping.set)
+
+    logger.info("Starting req-hunter scrape worker in %s mode", settings.app_env)
+    scrape_process_pool.start(processes)
+    await scrape_scheduler.start()
+    await run_queue.start()
+    try:
+        await stopping.wait()
+    finally:
+        logger.info("Shutting down req-hunter scrape worker")
+        await scrape_scheduler.halt()
+        await run_queue.halt()
+        # Child processes finish the scrapes they started before the leases
+        # are released, so no other worker can claim those sources meanwhile.
+        await scrape_process_pool.close()
+        await scrape_scheduler.stop()
+        await run_queue.stop()
+        await browser_pool.close()
+        await http_pool.close()
+        await scrape_engine.dispose()
+        await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.worker",
+        description="Run scheduled and submitted scrapes outside the API server.",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=settings.worker_processes,
+        help="child processes for browser-based scrapes (0 = scrape in this process)",
+    )
+    args = parser.parse_args(argv)
+    configure_logging()
+    asyncio.run(_serve(args.processes))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""Canonical URLs and fingerprints used to skip duplicate postings."""
+
+import pytest
+
+from app.scraper.dedupe import canonicalize_url, job_fingerprint
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        (
+            "https://jobs.example.com/posting/1?utm_source=li&gh_src=abc&trk=x&id=7",
+            "https://jobs.example.com/posting/1?id=7",
+        ),
+        ("https://jobs.example.com/posting/1?b=2&a=1", "https://jobs.example.com/posting/1?a=1&b=2"),
+        ("https://jobs.example.com/en-US/posting/1/", "https://jobs.example.com/posting/1"),
+        ("https://jobs.example.com/de_de/posting/1", "https://jobs.example.com/posting/1"),
+        ("HTTP://WWW.Jobs.Example.com/posting/1", "https://jobs.example.com/posting/1"),
+        ("https://jobs.example.com/posting/1#apply", "https://jobs.example.com/posting/1"),
+        ("https://jobs.example.com/#/job/123", "https://jobs.example.com/#/job/123"),
+        ("https://jobs.example.com/#!/job/123", "https://jobs.example.com/#!/job/123"),
+    ],
+)
+def test_canonicalize_url(url: str, expected: str) -> None:
+    assert canonicalize_url(url) == expected
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("http://jobs.example.com:80/posting/1", "https://jobs.example.com/posting/1"),
+        ("https://jobs.example.com:443/posting/1", "https://jobs.example.com/posting/1"),
+        ("https://jobs.example.com:8443/posting/1", "https://jobs.example.com:8443/posting/1"),
+    ],
+)
+def test_canonicalize_url_default_ports(url: str, expected: str) -> None:
+    assert canonicalize_url(url) == expected
+
+
+def test_job_fingerprint_normalizes_text() -> None:
+    assert job_fingerprint("Senior  Engineer", "Acme, Inc.", "Berlin") == job_fingerprint(
+        "senior engineer", "ACME Inc", "berlin"
+    )
+    assert job_fingerprint("Senior Engineer", "Acme", "Berlin") != job_fingerprint(
+        "Senior Engineer", "Acme", "Munich"
+    )
+
+
+@pytest.mark.parametrize("location", [None, "", " - "])
+def test_job_fingerprint_without_location(location: str | None) -> None:
+    assert job_fingerprint("Senior Engineer", "Acme", location) is None
@@ -0,0 +1,87 @@
+"""Bulk status updates and the rollup changes they record."""
+
+from datetime import datetime, timezone
+
+from pydantic import ValidationError
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models import JobStatus
+from app.routers.jobs import bulk_update_job_status
+from app.schemas import JobBulkUpdate, JobFilter
+
+
+class _Result:
+    def __init__(self, rows: list[tuple[object, ...]]) -> None:
+        self._rows = rows
+
+    def tuples(self) -> "_Result":
+        return self
+
+    def all(self) -> list[tuple[object, ...]]:
+        return self._rows
+
+
+class _RecordingSession:
+    """Stands in for AsyncSession: compiles each statement as asyncpg would."""
+
+    def __init__(self, returning: list[tuple[object, ...]]) -> None:
+        self.info: dict[str, object] = {}
+        self.statements: list[tuple[str, dict[str, object]]] = []
+        self._returning = returning
+
+    async def execute(self, statement: object) -> _Result:
+        compiled = statement.compile(dialect=postgresql.asyncpg.dialect())
+        self.statements.append((str(compiled), compiled.params))
+        return _Result(self._returning if len(self.statements) == 1 else [])
+
+
+def test_bulk_update_requires_exactly_one_selection() -> None:
+    with pytest.raises(ValidationError):
+        JobBulkUpdate(status=JobStatus.APPLIED)
+    with pytest.raises(ValidationError):
+        JobBulkUpdate(status=JobStatus.APPLIED, ids=[1], filter=JobFilter(company="Acme"))
+    with pytest.raises(ValidationError):
+        JobBulkUpdate(status=JobStatus.APPLIED, filter=JobFilter())
+
+
+async def test_bulk_update_returns_previous_status_for_rollups() -> None:
+    scraped_at = datetime(2026, 10, 1, 12, tzinfo=timezone.utc)
+    db = _RecordingSession(
+        [
+            (1, 7, scraped_at, JobStatus.NEW),
+            (2, 7, scraped_at, JobStatus.APPLIED),
+        ]
+    )
+    payload = JobBulkUpdate(status=JobStatus.APPLIED, ids=[1, 2])
+
+    result = await bulk_update_job_status(payload, db)
+
+    assert result.updated == 2
+    assert result.ids == [1, 2]
+    assert db.info
+    update_sql, _ = db.statements[0]
+    assert update_sql.startswith("UPDATE jobs SET status=")
+    assert "FOR UPDATE" in update_sql
+    assert "RETURNING jobs.id, jobs.source_id, jobs.scraped_at, previous.status" in update_sql
+    # Only job 1 changed status: one count moves from NEW to APPLIED.
+    assert len(db.statements) == 2
+    rollup_sql, params = db.statements[1]
+    assert rollup_sql.startswith("INSERT INTO job_daily_stats")
+    assert "ON CONFLICT (source_id, day, status) DO UPDATE" in rollup_sql
+    counts = {params[f"status_m{i}"]: params[f"job_count_m{i}"] for i in range(2)}
+    assert counts == {JobStatus.NEW: -1, JobStatus.APPLIED: 1}
+
+
+async def test_bulk_update_without_matches_changes_nothing() -> None:
+    db = _RecordingSession([])
+    payload = JobBulkUpdate(status=JobStatus.IGNORED, filter=JobFilter(location="50%_off"))
+
+    result = await bulk_update_job_status(payload, db)
+
+    assert result.updated == 0
+    assert not db.info
+    assert len(db.statements) == 1
+    update_sql, params = db.statements[0]
+    assert "ILIKE" in update_sql.upper()
+    assert "%50/%/_off%" in params.values()
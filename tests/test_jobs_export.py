@@ -0,0 +1,93 @@
+"""Streaming job exports in both formats."""
+
+from collections.abc import AsyncIterator
+import csv
+from datetime import datetime, timezone
+import io
+import json
+
+import pytest
+from sqlalchemy import Select, select
+
+from app.models import JobStatus
+from app.routers import jobs
+from app.routers.jobs import _EXPORT_COLUMNS, _stream_export
+
+_SCRAPED_AT = datetime(2026, 10, 1, 12, tzinfo=timezone.utc)
+_ROWS = [
+    (
+        i,
+        f"Engineer {i}",
+        "Acme",
+        'Berlin, "DE"',
+        f"https://acme.example/jobs/{i}",
+        None,
+        "acme",
+        3,
+        JobStatus.NEW,
+        _SCRAPED_AT,
+        _SCRAPED_AT,
+    )
+    for i in range(3)
+]
+
+
+class _StreamResult:
+    def __init__(self, rows: list[tuple[object, ...]]) -> None:
+        self._rows = rows
+
+    async def partitions(self) -> AsyncIterator[list[tuple[object, ...]]]:
+        # Two partitions, as yield_per would produce for a larger export.
+        yield self._rows[:2]
+        yield self._rows[2:]
+
+
+class _StreamingSession:
+    def __init__(self) -> None:
+        self.options: dict[str, object] = {}
+
+    async def __aenter__(self) -> "_StreamingSession":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+    async def stream(self, statement: Select) -> _StreamResult:
+        self.options = statement.get_execution_options()
+        return _StreamResult(_ROWS)
+
+
+@pytest.fixture
+def session(monkeypatch: pytest.MonkeyPatch) -> _StreamingSession:
+    db = _StreamingSession()
+    monkeypatch.setattr(jobs, "AsyncSessionLocal", lambda: db)
+    return db
+
+
+async def _collect(fmt: str) -> list[str]:
+    return [chunk async for chunk in _stream_export(select(*_EXPORT_COLUMNS), fmt)]
+
+
+async def test_csv_export_streams_header_then_rows(session: _StreamingSession) -> None:
+    chunks = await _collect("csv")
+
+    assert len(chunks) == 3
+    assert session.options["yield_per"] == jobs._EXPORT_BATCH_SIZE
+    rows = list(csv.reader(io.StringIO("".join(chunks))))
+    assert rows[0] == [column.key for column in _EXPORT_COLUMNS]
+    assert rows[1][:4] == ["0", "Engineer 0", "Acme", 'Berlin, "DE"']
+    assert rows[1][8:] == ["new", _SCRAPED_AT.isoformat(), _SCRAPED_AT.isoformat()]
+    assert len(rows) == 4
+
+
+async def test_ndjson_export_writes_one_object_per_line(session: _StreamingSession) -> None:
+    chunks = await _collect("ndjson")
+
+    assert len(chunks) == 2
+    lines = "".join(chunks).splitlines()
+    assert len(lines) == 3
+    first = json.loads(lines[0])
+    assert first["id"] == 0
+    assert first["description"] is None
+    assert first["status"] == "new"
+    assert first["scraped_at"] == _SCRAPED_AT.isoformat()
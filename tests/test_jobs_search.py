@@ -0,0 +1,35 @@
+"""Full-text search combined with the planner's estimated count."""
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models import Job, JobStatus
+from app.routers.jobs import _estimate_count, _search_clause
+
+
+class _PlanningSession:
+    """Stands in for AsyncSession: compiles the statement as asyncpg would."""
+
+    def __init__(self) -> None:
+        self.sql = ""
+        self.params: dict[str, object] = {}
+
+    async def scalar(self, statement: object) -> list[dict[str, object]]:
+        compiled = statement.compile(dialect=postgresql.asyncpg.dialect())
+        self.sql = str(compiled)
+        self.params = compiled.params
+        return [{"Plan": {"Plan Rows": 42}}]
+
+
+async def test_estimated_count_with_search_binds_parameters() -> None:
+    q = "senior 'python' engineer"
+    match, _ = _search_clause(q, fuzzy=True)
+    query = select(Job).where(Job.status == JobStatus.NEW, match)
+    db = _PlanningSession()
+
+    assert await _estimate_count(db, query) == 42
+    assert db.sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "websearch_to_tsquery($" in db.sql
+    assert q not in db.sql
+    assert q in db.params.values()
+    assert "english" in db.params.values()
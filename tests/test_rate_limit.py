@@ -0,0 +1,46 @@
+"""Per-host token buckets."""
+
+import pytest
+
+from app.config import settings
+from app.scraper.rate_limit import HostRateLimiter, TokenBucket
+
+
+@pytest.fixture
+def limits(monkeypatch: pytest.MonkeyPatch) -> HostRateLimiter:
+    monkeypatch.setattr(settings, "scraper_delay_seconds", 2.0)
+    monkeypatch.setattr(settings, "scraper_host_burst", 1)
+    monkeypatch.setattr(settings, "workday_page_concurrency", 4)
+    monkeypatch.setattr(
+        settings,
+        "scraper_host_rate_overrides",
+        {"example.com": (1.0, 3), "slow.example.com": (10.0, 1), "free.example.org": (0, 1)},
+    )
+    return HostRateLimiter()
+
+
+def test_default_limits(limits: HostRateLimiter) -> None:
+    assert limits._limits("jobs.other.com") == (0.5, 1)
+
+
+def test_most_specific_override_wins(limits: HostRateLimiter) -> None:
+    assert limits._limits("example.com") == (1.0, 3)
+    assert limits._limits("jobs.example.com") == (1.0, 3)
+    assert limits._limits("slow.example.com") == (0.1, 1)
+    assert limits._limits("notexample.com") == (0.5, 1)
+
+
+def test_zero_delay_disables_limiting(limits: HostRateLimiter) -> None:
+    assert limits._limits("free.example.org") == (0.0, 1)
+
+
+def test_workday_hosts_default_to_page_concurrency(limits: HostRateLimiter) -> None:
+    assert limits._limits("acme.wd5.myworkdayjobs.com") == (2.0, 4)
+
+
+async def test_bucket_waits_once_the_burst_is_spent() -> None:
+    bucket = TokenBucket(rate=100.0, burst=2)
+
+    assert await bucket.acquire() == 0.0
+    assert await bucket.acquire() == 0.0
+    assert await bucket.acquire() > 0.0
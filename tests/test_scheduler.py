@@ -0,0 +1,70 @@
+"""Adaptive scrape intervals."""
+
+from datetime import timedelta
+
+import pytest
+
+from app.models import ScrapeSchedule, Source
+from app.scheduler import adapt_interval
+
+_SCHEDULE = ScrapeSchedule(interval_minutes=60)
+
+
+def _source(**values: object) -> Source:
+    defaults: dict[str, object] = {
+        "name": "Acme",
+        "base_url": "https://acme.example/jobs",
+        "keyword": "engineer",
+        "consecutive_failures": 0,
+        "new_jobs_per_hour": 0.0,
+        "current_interval_minutes": 60,
+    }
+    return Source(**{**defaults, **values})
+
+
+def test_failures_back_off_exponentially_up_to_the_ceiling() -> None:
+    source = _source(consecutive_failures=2)
+
+    minutes, reason = adapt_interval(source, _SCHEDULE, 0, failed=True)
+
+    assert source.consecutive_failures == 3
+    assert minutes == 480
+    assert reason == "backing off after 3 failed run(s) in a row"
+    source.consecutive_failures = 10
+    assert adapt_interval(source, _SCHEDULE, 0, failed=True)[0] == 1440
+
+
+def test_first_run_keeps_the_base_interval() -> None:
+    source = _source(new_jobs_per_hour=None, consecutive_failures=4)
+
+    minutes, reason = adapt_interval(source, _SCHEDULE, 500, failed=False)
+
+    assert (minutes, reason) == (60, "default interval until new-job rate is known")
+    assert source.new_jobs_per_hour == 0.0
+    assert source.consecutive_failures == 0
+
+
+def test_rate_uses_the_time_since_the_previous_scrape() -> None:
+    # 48 new jobs after a two-day outage is one job an hour, not 48.
+    after_outage = _source(new_jobs_per_hour=1.0)
+    adapt_interval(after_outage, _SCHEDULE, 48, failed=False, elapsed=timedelta(days=2))
+    assert after_outage.new_jobs_per_hour == pytest.approx(1.0)
+
+    # Without a previous scrape time the current interval is the window.
+    by_interval = _source(new_jobs_per_hour=1.0)
+    adapt_interval(by_interval, _SCHEDULE, 48, failed=False)
+    assert by_interval.new_jobs_per_hour == pytest.approx(0.3 * 48 + 0.7 * 1.0)
+
+
+def test_interval_targets_new_jobs_per_run_within_bounds() -> None:
+    busy = _source(new_jobs_per_hour=8.0)
+    assert adapt_interval(busy, _SCHEDULE, 8, failed=False, elapsed=timedelta(hours=1))[0] == 15
+
+    steady = _source(new_jobs_per_hour=1.0)
+    minutes, reason = adapt_interval(
+        steady, _SCHEDULE, 1, failed=False, elapsed=timedelta(hours=1)
+    )
+    assert (minutes, reason) == (120, "24.0 new jobs/day observed")
+
+    fixed = _source(new_jobs_per_hour=8.0, scrape_interval_minutes=30)
+    assert adapt_interval(fixed, _SCHEDULE, 8, failed=False) == (30, "fixed per-source interval")